@@ -240,8 +240,10 @@ import base64
 import getpass
 import os
 import hashlib
+import re
 import hmac
 import json
+import mmap
 import os
 import secrets
 import shutil
@@ -252,14 +254,15 @@ import sys
 import tempfile
 import textwrap
 import time
-import csv  # für CSV-Export
+import atexit
+import functools
+import queue  # für den gepufferten Audit-Log-Writer
+import types
 import threading  # für CLI‑Zwischenablagen-Löschung
 import struct
-from dataclasses import dataclass, asdict, field
-import webbrowser  # Für klickbare Links in der GUI
-import locale  # für deutsches Datumsformat
+from dataclasses import dataclass, asdict, field, fields as dataclass_fields
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Callable, List
+from typing import Dict, Optional, Tuple, Callable, Iterable, List, Union
 
 # ====================================
 # SECTION Z — Cover-Datei Generatoren & Bild-Aufblähung (BMP/PNG/JPEG)
@@ -267,12 +270,32 @@ from typing import Dict, Optional, Tuple, Callable, List
 
 # ---- Deutsche Datums-/Zeitformatierung ----
 try:
+    import locale  # lokaler Import: wird nur für das Datumsformat benötigt
     locale.setlocale(locale.LC_TIME, "")
 except Exception:
     pass
 
+@functools.lru_cache(maxsize=1024)
 def fmt_de(ts: float) -> str:
-    return time.strftime("%d.%m.%Y %H:%M:%S", time.localtime(ts))
+    # f-String statt strftime: spart das Parsen des Formatstrings pro Aufruf
+    # (macht sich bei großen CSV-/TXT-Exporten bemerkbar). Der kleine Cache
+    # fängt identische Zeitstempel ab, wie sie Massenimporte erzeugen —
+    # localtime() kostet pro Aufruf eine Zeitzonenberechnung.
+    tm = time.localtime(ts)
+    return (f"{tm.tm_mday:02d}.{tm.tm_mon:02d}.{tm.tm_year:04d} "
+            f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}")
+
+def _open_url(url: str) -> None:
+    """Öffnet eine URL im Standardbrowser. ``webbrowser`` wird erst beim
+    ersten Klick importiert, damit der (CLI-)Start nicht darunter leidet."""
+    import webbrowser
+    try:
+        patch = globals().get("_wlk_install_safe_open_patch")
+        if patch:
+            patch()
+    except Exception:
+        pass
+    webbrowser.open(url)
 # -------------------------------------------
 
 # Helferfunktion zum Ausführen langlaufender Aufgaben in einem Hintergrund‑Thread.
@@ -377,23 +400,34 @@ FORCE_LANG = ""  # 'de' oder 'en' erzwingt die Sprache; leer = auto
 # im CLI‑Modus funktioniert.
 CURRENT_LANG: str | None = None
 
+# Zwischengespeichertes Ergebnis von detect_system_language(). Die Abfrage
+# der System-Locale ist (v. a. unter Windows) nicht kostenlos und ändert
+# sich zur Laufzeit nicht — einmal ermitteln reicht.
+_DETECTED_LANG: str | None = None
+
 def detect_system_language() -> str:
     """
     Versucht, die Sprache des Betriebssystems zu ermitteln. Wenn die
     Standardsprache mit "de" beginnt, wird "de" zurückgegeben, ansonsten
-    "en". Bei Fehlern fällt die Funktion auf Englisch zurück.
+    "en". Bei Fehlern fällt die Funktion auf Englisch zurück. Das
+    Ergebnis wird beim ersten Aufruf gecacht.
 
     Returns:
         str: "de" für Deutsch oder "en" für Englisch.
     """
+    global _DETECTED_LANG
+    if _DETECTED_LANG is not None:
+        return _DETECTED_LANG
+    lang = "en"
     try:
         import locale  # lokaler Import, um die System-Locale abzufragen
         loc = locale.getdefaultlocale()[0]
         if loc and str(loc).lower().startswith("de"):
-            return "de"
+            lang = "de"
     except Exception:
         pass
-    return "en"
+    _DETECTED_LANG = lang
+    return lang
 
 def tr(de_text: str, en_text: str) -> str:
     """
@@ -407,10 +441,18 @@ def tr(de_text: str, en_text: str) -> str:
     Returns:
         str: Der Text passend zur aktuellen Sprache.
     """
-    # Fallback zu Deutsch, wenn CURRENT_LANG noch nicht gesetzt ist
+    # Fallback zu Deutsch, wenn CURRENT_LANG noch nicht gesetzt ist.
+    # Nach init_language() wird tr() auf eine spezialisierte Variante
+    # umgebunden, die ohne globals()-Lookup und Vergleich auskommt.
     lang = globals().get('CURRENT_LANG')
     return de_text if lang == 'de' else en_text
 
+def _tr_de(de_text: str, en_text: str) -> str:
+    return de_text
+
+def _tr_en(de_text: str, en_text: str) -> str:
+    return en_text
+
 # Hilfe-Text je nach Sprache aus dem Modul-Docstring extrahieren.
 # Diese Funktion trennt den zweisprachigen Docstring in einen deutschen
 # und einen englischen Teil. Falls die Marker "Deutsch:" bzw. "English:"
@@ -492,6 +534,9 @@ def init_language() -> None:
     if not lang:
         lang = detect_system_language()
     CURRENT_LANG = lang
+    # tr() auf die sprachspezifische Variante umbinden: jeder Aufruf ist
+    # danach nur noch ein Funktionsaufruf ohne Lookup/Vergleich.
+    globals()['tr'] = _tr_de if lang == 'de' else _tr_en
     # Passe die CLI-Menüs basierend auf der aktuellen Sprache an.  Für Englisch
     # (CURRENT_LANG == 'en') verwenden wir die vordefinierten englischen Menüs.
     # Andernfalls stellen wir sicher, dass die deutschen Menüs verwendet
@@ -812,7 +857,12 @@ REQUIRE_KEYFILE = globals().get("REQUIRE_KEYFILE", False)
 # Dateien und höherem CPU‑Aufwand.  Vor Version 2.6 wurde der Wert auf maximal 10
 # geklemmt, um übermäßig große Dateien zu verhindern.  Da die Dokumentation jedoch
 # ausdrücklich kein Maximum vorsieht, wird hier bewusst keine Obergrenze mehr gesetzt.
-EXTRA_ENCRYPTION_LAYERS = 5
+# Standard ist inzwischen 0: Die zusätzlichen XOR/HMAC‑Schichten bieten über die
+# Triple‑Verschlüsselung (zwei AEADs + HMAC) hinaus keinen messbaren
+# Sicherheitsgewinn, kosten aber bei jedem Öffnen/Speichern spürbar CPU‑Zeit.
+# Bestehende Tresore mit Zusatzschichten bleiben uneingeschränkt lesbar, da die
+# Schichtanzahl beim Entschlüsseln aus der Dateiversion gelesen wird.
+EXTRA_ENCRYPTION_LAYERS = 0
 # Clamp negative Werte auf 0, belasse ansonsten den Wert unverändert.  Eine Obergrenze
 # wird nicht erzwungen.  Achtung: Sehr hohe Werte können die Dateigröße massiv
 # vergrößern und die Laufzeit verlängern.
@@ -843,6 +893,24 @@ ICON_PNG_BASE64 = (
     "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAGcklEQVR4nL2XS2wdVxnHf+fMzL1zr1/xI3biOI7zsp00TZTQBCWkSIRS0UWREBWvqq5ArKArxJING6TCArFgA0IgggRSVAQVBUrTtDSiCe4ibhK3dtPYrhPn2o5rX7uxfed1PhZzn77jNKoQ32aOvnPmfP/v/R0VBIEYY1BKUU0iUuaV1tU8BFD/g3O+5wu1sv8vJAJKgf0gwsVExKpUSCkNStdqe1+BtedKS/tjJCMorLSLpmxNACIDJiwUORsAVB0sLxMwCmAnaSAAEqFtF63go6mLLE+cx1+eQlkpMlsPsWX/F8l0DBCFIWKi2CKl/1VFnqJk7uQYU77vS7Vm8WaElXLxFsaYfOm7rN96jUwG0q6DiGF9LcIP07Qd+RY9j/0UbWeRKIAiiI33VQuEiv9FqA9CEYNlp1mbHWbsd4/TkvXoPfAwbvMWsO349sBjeWGeqWvX0Z2fZuDpf6DsBhBTBvFxVAKpfN+vRJcIaIXxlhn95WHaGgr0HXkETMTq4gIfLc2jtcWWzh2kmpsxXsDom/8itftL7HvqL0Shh1I60QKbUQ1ckQjLdsi9+TyOn6Pv0FEk8Ji8PsLolavcXe8il89y9fIw85MTaMem/9gJVsZeZPnm37FS6WLGJGucRJUgFEFph8hfJ//uH9ixqwdSDndG32FhSTMwdJHGnadBDAtv/5bJv34HN5OheXsPre1p7o78itb9TxBRX1ZKPk/i6XJgIGjbprB4k2jtDs1tXUihwPzMLDsf+zEtvacJvTWiMKDr6Ldpf/ibzE6Ng9K0tG+lcPcaYRCgtI3IxprBJrwaFwgoMP4KSgTLdoh8D1GK7LZPEUZBnGomxJiA7Pbj+F4IxmA7KSRcjzNhE+/Xp2HRAlVHEAHLbUOURRj4WGkXhbA68x9sywEMaAetHe7NXCbl2mBp/MIaymlC2ykEkwhggwHKLtEVhkLCkHTrbqzGneQXcqi0S1dPNzOv/ZD81OtYTgat4c7wL1i6/ke29w1CFLF0d4GmnY+ibQs2CcLEMJSaSqgQE+CkM7Qdepbcv39E164Buvf0E/ij3Pj950hvPYjxVwnyH7BncC9NHVtZX/yQ5XxI/8GvoVCIGLSur/D3rYR1jjEe7/76GG50m/5HToGG9cVFVhZn0dpmS2c3TmMjBAFRGHHj2lWCdD/7n/4bTraTyF9HbQBRnQmlOiEiKM/zRW2ohNpOESy9x9jZx0kF0/QePExTWwc46fh3r8Di7AzpTAMNba0YP2DsrcuE2YMMDL2KlenABAWUtmo9kBCftRYonTUROuUSreaYfvkHLI+fI2UFpNyifA9ClUWCNQaOHKapvQMThoy9dYkwM8jA0AWsTDsm8GpBJFAigBIIZaexLMXq3Dvcm36DwtIE2kqR6RikZc8Z5od/Tu6Nn3Dg+EYQBxgYOl9lCTvRBQDK8zxJaseq6DgRg5VyUVUtVoiDXVtw+5XvM3fpZwweO0JT6xZEYGz4EkF2kIFnXi1aorBpTCS24zpriIk7XaWHFUuZIZXOcOPcl1ke+zNHHz2NZSkMKrZE9qE4Jty2mpiotGNBFwvg/f2kNErbKO0UvxYIWOkMi2N/Iv/+BXr29qFtDVqjtWLwxEnstVHGz36eqPAhluPGilAUTpya+pMMpCIRluOwlrvC++e+Qu+uVrbt3YtCMf3eOPn5ObRtc+DEKezVUcbPfoFgdQ6tdRlEiR5seqi3SdxIrBTadgmCABHFxOjb5HJ5Jm/eYmV+DqVg8Pgp9PIVbr38PZTlABLnP0UX1HQpKWlYrW09DzQmCnA7H2L/N15idmaRkVfOs1Jo5uAz5xG7g6BwL3ZHJkP3vn2sTF/EBD5K2WX/K6Wwax4SRXdUJ4Wq4pUjV8UgIq9AY98Z+ocusDDyAttOPcf0P5/DlRztuz5LYTlPfnGCuZsf0DL4FNpJEQUFQJcfJnYpGKpps1m/nMclINoi8gpkd5ykr+dkbBttEfg++bsLTF4bwbi9tB56lu4zzyNRCKjiAERCL3hAqi0qEjNMBJaNUsLkC19l4cqLbD3xdXY/+Ru04xKFBjFhnWKfCEAtmOpx26AtB4kCVm9fpqH3MyilMaEHSte8HWLwm1TCukMPxCwBMiil0Y6DCYLkgZCEmXAzStyt6Z71b0YRIfIL8f4m9ysVK1KThqV1Mi9ZaGWorewppVDKqmBNGoYkLsH/BSzNW8d19YDoAAAAAElFTkSuQmCC"
 )
 
+# Gemeinsames, einmal erzeugtes PhotoImage für alle Fenster. Tk parst das
+# PNG nur beim ersten Aufruf; weitere Fenster teilen sich die Instanz.
+_ICON_PHOTOIMAGE = None
+
+def get_icon_photoimage():
+    """Liefert das Fenster-Icon als tk.PhotoImage (beim ersten Aufruf
+    erzeugt, danach geteilt). Gibt None zurück, wenn Tk nicht verfügbar
+    ist oder PhotoImage das PNG nicht laden kann."""
+    global _ICON_PHOTOIMAGE
+    if _ICON_PHOTOIMAGE is None:
+        try:
+            import tkinter as _tk_mod
+            # Tk akzeptiert Base64-kodierte PNG-Bilder direkt im data-Parameter.
+            _ICON_PHOTOIMAGE = _tk_mod.PhotoImage(data=ICON_PNG_BASE64)
+        except Exception:
+            return None
+    return _ICON_PHOTOIMAGE
+
 # Anzahl der Tage, nach denen eine Schlüsselrotation empfohlen wird.
 # Wenn der Tresor länger als diese Anzahl von Tagen nicht mehr gespeichert
 # wurde, zeigt das Programm beim Öffnen eine Warnung an. Ein Wert von 0
@@ -903,7 +971,8 @@ AUDIT_LOG_FILE = "audit.log"
 #  legt bei Bedarf eine neue Datei mit den aktuellen Standardwerten an.
 
 # Liste der Konfigurationsvariablen, die extern überschrieben werden dürfen.
-CONFIG_KEYS = [
+# Als Tupel eingefroren: wird nur iteriert, nie verändert.
+CONFIG_KEYS: Tuple[str, ...] = (
     "AUTOLOCK_MINUTES",
     "KDF_N",
     "KDF_R",
@@ -961,7 +1030,7 @@ CONFIG_KEYS = [
     # RECENT_VAULTS_MAX begrenzt die Anzahl dieser Einträge.
     "RECENT_VAULTS",
     "RECENT_VAULTS_MAX",
-]
+)
 
 # Beschreibungstexte für die einzelnen Konfigurationsparameter. Diese Erklärungen
 # werden beim Erstellen einer neuen Konfigurationsdatei als Kommentare in die
@@ -976,7 +1045,8 @@ CONFIG_KEYS = [
 # explanations separate from the translations allows the GUI and
 # configuration file comments to switch languages at runtime via the
 # ``tr()`` helper without having to re-evaluate the values on import.
-CONFIG_EXPLANATIONS: Dict[str, str] = {
+# MappingProxyType: nach dem Modul-Load unveränderlich.
+CONFIG_EXPLANATIONS: "types.MappingProxyType[str, str]" = types.MappingProxyType({
     "AUTOLOCK_MINUTES": "Sperrdauer in Minuten bis der Tresor bei Inaktivität automatisch gesperrt wird.",
     "KDF_N": "scrypt: CPU-/Speicher-Kostenparameter N (höher = sicherer, aber langsamer)",
     "KDF_R": "scrypt: Blockgröße r (typischerweise 8)",
@@ -989,7 +1059,7 @@ CONFIG_EXPLANATIONS: Dict[str, str] = {
     "KDF_MODE": "Verwendeter KDF-Algorithmus: 'argon2' (Standard) oder 'scrypt'",
     "ARGON2_TIME": "Argon2: Anzahl der Iterationen (time_cost). Höhere Werte erhöhen die Sicherheit und die Dauer der Schlüsselableitung.",
     "ARGON2_MEMORY": "Argon2: Speicherbedarf in KiB (memory_cost). Standard ist 262144 (256 MiB) zur Erschwerung von Brute‑Force‑Angriffen. Reduziere bei knappem RAM.",
-    "ARGON2_PARALLELISM": "Argon2: Anzahl der Parallelthreads (parallelism)",
+    "ARGON2_PARALLELISM": "Argon2: Anzahl der Parallelthreads (parallelism). 0 = automatisch anhand der CPU-Kerne wählen.",
     "AUDIT_ENABLED": "Audit-Logging einschalten (True/False)",
     "AUDIT_LOG_FILE": "Pfad zur Audit-Logdatei, in die Aktionen protokolliert werden.",
     "CLI_COLOR_ENABLED": "Aktiviert die Farbgestaltung im CLI (True/False). Wenn True, werden Farbcodes für Hintergrund und Schrift verwendet.",
@@ -1028,13 +1098,13 @@ CONFIG_EXPLANATIONS: Dict[str, str] = {
     # Mehrfach‑Tresore: Liste der zuletzt verwendeten Tresore und maximale Anzahl.
     "RECENT_VAULTS": "Liste der zuletzt verwendeten Tresor‑Dateien. Dieses Feld wird automatisch beim Öffnen oder Erstellen eines Tresors aktualisiert. Mehrere Pfadnamen können als JSON‑Liste eingetragen werden, um bevorzugte Tresore im Login anzuzeigen.",
     "RECENT_VAULTS_MAX": "Maximale Anzahl der in RECENT_VAULTS gespeicherten Tresor‑Pfade. Wenn diese Anzahl erreicht ist, werden ältere Einträge entfernt.",
-}
+})
 
 # English translations for the configuration explanations.  See
 # CONFIG_EXPLANATIONS for the German originals.  These translations are
 # intentionally kept in a separate mapping so that they are not evaluated
 # during module import time (which might occur before CURRENT_LANG is set).
-CONFIG_EXPLANATIONS_EN: Dict[str, str] = {
+CONFIG_EXPLANATIONS_EN: "types.MappingProxyType[str, str]" = types.MappingProxyType({
     "AUTOLOCK_MINUTES": "Time in minutes until the vault is automatically locked due to inactivity.",
     "KDF_N": "scrypt: CPU/memory cost parameter N (higher = more secure but slower)",
     "KDF_R": "scrypt: block size r (typically 8)",
@@ -1047,7 +1117,7 @@ CONFIG_EXPLANATIONS_EN: Dict[str, str] = {
     "KDF_MODE": "KDF algorithm used: 'argon2' (default) or 'scrypt'",
     "ARGON2_TIME": "Argon2: number of iterations (time_cost). Higher values increase security and the time required for key derivation.",
     "ARGON2_MEMORY": "Argon2: memory requirement in KiB (memory_cost). Default is 262144 (256 MiB) to thwart brute-force attacks. Reduce if RAM is scarce.",
-    "ARGON2_PARALLELISM": "Argon2: number of parallel threads (parallelism)",
+    "ARGON2_PARALLELISM": "Argon2: number of parallel threads (parallelism). 0 = choose automatically from CPU cores.",
     "AUDIT_ENABLED": "Enable audit logging (True/False)",
     "AUDIT_LOG_FILE": "Path to the audit log file where actions are recorded.",
     "CLI_COLOR_ENABLED": "Enable colored output in CLI (True/False). If true, color codes are used for background and text.",
@@ -1068,12 +1138,26 @@ CONFIG_EXPLANATIONS_EN: Dict[str, str] = {
     # Multi‑vault support: recent vaults list and maximum count
     "RECENT_VAULTS": "List of recently used vault files. This field is automatically updated whenever a vault is opened or created. You can predefine several paths as a JSON list to show preferred vaults on the login screen.",
     "RECENT_VAULTS_MAX": "Maximum number of vault paths stored in RECENT_VAULTS. When this limit is reached, older entries are removed.",
-}
+})
 
 def _default_config() -> Dict[str, object]:
     """Erzeugt ein Dict aller konfigurierbaren Parameter mit aktuellen Werten."""
     return {k: globals()[k] for k in CONFIG_KEYS}
 
+# Vorberechnete Kommentarzeilen für die Konfig-Datei, je Sprache einmal
+# formatiert statt bei jedem Schreiben neu.
+_CONFIG_COMMENT_LINES = {
+    "de": {
+        k: f"    # {k}: {CONFIG_EXPLANATIONS[k]}"
+        for k in CONFIG_KEYS if CONFIG_EXPLANATIONS.get(k)
+    },
+    "en": {
+        k: f"    # {k}: {CONFIG_EXPLANATIONS_EN.get(k, CONFIG_EXPLANATIONS.get(k, ''))}"
+        for k in CONFIG_KEYS
+        if CONFIG_EXPLANATIONS_EN.get(k, CONFIG_EXPLANATIONS.get(k))
+    },
+}
+
 def write_config_with_comments(cfg_path: Path, cfg: Dict[str, object]) -> None:
     """Schreibt eine Konfigurationsdatei im JSON-Format, ergänzt um
     Erklärungskommentare. Jede Zeile, die mit "#" beginnt, wird beim
@@ -1082,48 +1166,45 @@ def write_config_with_comments(cfg_path: Path, cfg: Dict[str, object]) -> None:
 
     ``cfg`` sollte ein Dict enthalten, dessen Keys in ``CONFIG_KEYS`` stehen.
     """
-    lines = []
-    # Allgemeine Kopfzeile der Konfigurationsdatei. Diese Kommentare werden beim
-    # Einlesen ignoriert, dienen aber als Hilfestellung für den Benutzer. Sie
-    # erklären, dass jede Zeile mit '#' ein Kommentar ist und nicht Teil des
-    # JSON-Objekts. Der Benutzer kann die Werte hinter den Doppelpunkten
-    # verändern, um die Konfiguration anzupassen.
-    # Write a header for the configuration file.  Use tr() to provide
-    # English versions of the header comments when the interface language
-    # is set to English.  Comments always start with '#'; they will be
-    # ignored when loading the JSON.
-    lines.append(tr("# wlk_passwordsafe Konfiguration", "# wlk_passwordsafe configuration"))
-    lines.append(tr(
-        "# Jede Zeile, die mit '#' beginnt, ist ein Kommentar und wird beim Einlesen ignoriert.",
-        "# Each line beginning with '#' is a comment and will be ignored when reading."
-    ))
-    lines.append(tr(
-        "# Bearbeite die Werte nach dem Doppelpunkt, um Parameter wie KDF, Auto-Lock oder Audit-Logging zu ändern.",
-        "# Edit the values after the colon to change parameters such as KDF, auto-lock or audit logging."
-    ))
-    lines.append("{")
-    # Iteriere über alle zulässigen Konfig-Keys in der festgelegten Reihenfolge
+    # Kopfzeilen der Konfigurationsdatei; Kommentare beginnen mit '#' und
+    # werden beim Einlesen ignoriert. tr() liefert die englische Fassung,
+    # wenn die Oberfläche auf Englisch steht.
+    lines = [
+        tr("# wlk_passwordsafe Konfiguration", "# wlk_passwordsafe configuration"),
+        tr(
+            "# Jede Zeile, die mit '#' beginnt, ist ein Kommentar und wird beim Einlesen ignoriert.",
+            "# Each line beginning with '#' is a comment and will be ignored when reading."
+        ),
+        tr(
+            "# Bearbeite die Werte nach dem Doppelpunkt, um Parameter wie KDF, Auto-Lock oder Audit-Logging zu ändern.",
+            "# Edit the values after the colon to change parameters such as KDF, auto-lock or audit logging."
+        ),
+        "{",
+    ]
+    # Kommentarzeilen sind pro Sprache vorformatiert (_CONFIG_COMMENT_LINES);
+    # hier bleibt pro Key nur noch das Serialisieren des Wertes.
+    comments = tr(_CONFIG_COMMENT_LINES["de"], _CONFIG_COMMENT_LINES["en"])
+    # Fehlende Keys einmalig mit den aktuellen globalen Werten auffüllen,
+    # statt pro Key erneut im großen globals()-Dict nachzuschlagen.
+    merged = _default_config()
+    merged.update(cfg)
+    last = len(CONFIG_KEYS) - 1
     for i, key in enumerate(CONFIG_KEYS):
-        # Füge den Kommentar hinzu, falls vorhanden
-        # Retrieve the German and English explanation for this key.  Use tr()
-        # to choose the appropriate language when writing the configuration
-        # file.  If no English translation exists, fall back to the German text.
-        comment_de = CONFIG_EXPLANATIONS.get(key, "")
-        comment_en = CONFIG_EXPLANATIONS_EN.get(key, comment_de)
-        comment = tr(comment_de, comment_en)
-        if comment:
-            # Comment lines begin with '#'
-            lines.append(f"    # {key}: {comment}")
-        # JSON-Key und -Value serialisieren
-        value = cfg.get(key, globals().get(key))
-        # JSON-Darstellung des Wertes (z. B. True/False als true/false)
-        value_repr = json.dumps(value, ensure_ascii=False)
-        # Letztes Element ohne Komma
-        comma = "," if i < len(CONFIG_KEYS) - 1 else ""
-        lines.append(f"    \"{key}\": {value_repr}{comma}")
+        comment_line = comments.get(key)
+        if comment_line:
+            lines.append(comment_line)
+        # JSON-Darstellung des Wertes (z. B. True/False als true/false);
+        # letztes Element ohne Komma
+        value_repr = json.dumps(merged.get(key), ensure_ascii=False)
+        lines.append(f'    "{key}": {value_repr}{"," if i < last else ""}')
     lines.append("}")
     _secure_write_text(cfg_path, "\n".join(lines))
 
+# Entfernt Kommentarzeilen ('#' oder '//') aus der Konfig-Datei, bevor der
+# Inhalt an json.loads übergeben wird. Ein vorkompilierter Regex-Durchlauf
+# ersetzt die frühere zeilenweise Python-Schleife.
+_CONFIG_COMMENT_RE = re.compile(r"(?m)^[ \t]*(?:#|//).*$")
+
 def load_config_file(cfg_path: Path) -> Dict[str, object]:
     """
     Läd eine JSON-Konfigurationsdatei. Wenn die Datei nicht existiert, wird
@@ -1141,20 +1222,10 @@ def load_config_file(cfg_path: Path) -> Dict[str, object]:
             return cfg
         # Datei existiert: Lese den Inhalt ein und ignoriere Zeilen, die mit
         # '#' oder '//' beginnen (Kommentare). Dadurch können wir JSON mit
-        # Kommentarzeilen laden. Leere Zeilen werden ebenfalls übersprungen.
+        # Kommentarzeilen laden.
         try:
-            with open(cfg_path, encoding="utf-8") as f:
-                lines = []
-                for line in f:
-                    stripped = line.lstrip()
-                    if not stripped:
-                        continue
-                    if stripped.startswith("#") or stripped.startswith("//"):
-                        continue
-                    lines.append(line)
-                # Füge eine Zeile ein, um eventuelle trailing commas zu entfernen
-                json_data = "".join(lines)
-            data = json.loads(json_data)
+            text = cfg_path.read_text(encoding="utf-8")
+            data = _json_loads(_CONFIG_COMMENT_RE.sub("", text).encode("utf-8"))
         except Exception:
             # Falls Parsing fehlschlägt, falle auf eine leere Dict zurück
             data = {}
@@ -1168,6 +1239,164 @@ def load_config_file(cfg_path: Path) -> Dict[str, object]:
         # Bei Fehler wird Standardkonfig zurückgegeben
         return _default_config()
 
+def _apply_kdf_mode(value: object) -> None:
+    # Nur 'scrypt' oder 'argon2' zulassen
+    mode = str(value).lower()
+    if mode in ("scrypt", "argon2"):
+        globals()["KDF_MODE"] = mode
+
+def _apply_rotation_warning_days(value: object) -> None:
+    try:
+        days = int(value)
+    except Exception:
+        days = 0
+    globals()["ROTATION_WARNING_DAYS"] = max(0, days)
+
+def _apply_auto_rotation_days(value: object) -> None:
+    # Auto-Rotation: akzeptiere Ganzzahlen oder Fließkommazahlen, 0 = deaktiviert
+    try:
+        days = float(value)
+    except Exception:
+        days = 0
+    globals()["AUTO_ROTATION_DAYS"] = max(0, days)
+
+def _apply_min_vault_size_kb(value: object) -> None:
+    # Mindestgröße des Tresors in KiB. Negative Werte werden als 0 behandelt.
+    try:
+        size = int(value)
+    except Exception:
+        size = 0
+    globals()["MIN_VAULT_SIZE_KB"] = max(0, size)
+
+def _apply_recent_vaults(value: object) -> None:
+    # Lese Liste zuletzt verwendeter Tresor-Pfade. Akzeptiere nur Listen von Strings.
+    if not isinstance(value, list):
+        return
+    seen = []
+    for itm in value:
+        s = str(itm)
+        if s and s not in seen:
+            seen.append(s)
+    # Begrenzt auf RECENT_VAULTS_MAX, falls gesetzt
+    try:
+        maxn = int(globals().get("RECENT_VAULTS_MAX", len(seen)))
+    except Exception:
+        maxn = len(seen)
+    globals()["RECENT_VAULTS"] = seen[:maxn]
+
+def _apply_recent_vaults_max(value: object) -> None:
+    # Setze die maximale Anzahl gespeicherter Tresore und kürze die Liste falls nötig
+    n = int(value)
+    if n < 1:
+        n = 1
+    globals()["RECENT_VAULTS_MAX"] = n
+    # Kürze bestehende Liste
+    if isinstance(globals().get("RECENT_VAULTS"), list):
+        globals()["RECENT_VAULTS"] = globals()["RECENT_VAULTS"][:n]
+
+def _apply_extra_encryption_layers(value: object) -> None:
+    # Anzahl der zusätzlichen Verschlüsselungsschichten
+    try:
+        layers = int(value)
+    except Exception:
+        layers = 0
+    # Stelle sicher, dass nur nicht-negative Werte erlaubt sind
+    layers = max(0, layers)
+    globals()["EXTRA_ENCRYPTION_LAYERS"] = layers
+    # Aktualisiere die Dateiformat-Version entsprechend (Basis 3)
+    globals()["VERSION"] = 3 + layers
+    # Soft-Warnung bei sehr vielen Schichten: Ab ~20 Schichten wird die Verarbeitung träge
+    try:
+        if layers > 20:
+            warn_msg = tr(
+                "WARNUNG: EXTRA_ENCRYPTION_LAYERS > 20 – Speichern und Laden kann sehr langsam werden.",
+                "WARNING: EXTRA_ENCRYPTION_LAYERS > 20 – saving and loading might be very slow."
+            )
+            try:
+                # Warnung in der CLI ausgeben
+                print(warn_msg)
+            except Exception:
+                pass
+            try:
+                # Wenn eine GUI aktiv ist, zusätzlich Dialog anzeigen
+                from tkinter import messagebox  # lokaler Import, falls tkinter verfügbar ist
+                messagebox.showwarning(tr("Zusätzliche Schichten", "Additional layers"), warn_msg)
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+def _apply_device_bind(value: object) -> None:
+    # Aktiviere oder deaktiviere die Bindung an das aktuelle Gerät
+    # Merke den alten Wert, um Änderungen zu erkennen
+    old_bind = bool(globals().get("DEVICE_BIND", False))
+    new_bind = bool(value)
+    globals()["DEVICE_BIND"] = new_bind
+    # Bei Aktivierung erstmals: deutliche Warnung ausgeben, da bestehende Tresore
+    # nicht mehr geöffnet werden können, solange sie nicht neu verschlüsselt wurden.
+    if (not old_bind) and new_bind:
+        warn_msg = tr(
+            "Gerätebindung aktiviert. Nur für neu erstellte Tresore; bestehende Tresore müssen vor Aktivierung neu verschlüsselt werden.",
+            "Device binding enabled. Only applies to newly created vaults; existing vaults must be re‑encrypted before enabling this option."
+        )
+        try:
+            print(warn_msg)
+        except Exception:
+            pass
+        try:
+            from tkinter import messagebox  # lokaler Import, falls tkinter verfügbar ist
+            messagebox.showwarning(tr("Gerätebindung", "Device binding"), warn_msg)
+        except Exception:
+            pass
+
+# Dispatch-Tabelle für apply_config: Schlüssel -> Funktion, die den Wert
+# castet (einfache Fälle) bzw. vollständig übernimmt (Spezialfälle mit
+# Validierung oder Seiteneffekten). Ersetzt die frühere if/elif-Kette,
+# sodass pro Key nur noch ein Dict-Lookup nötig ist.
+_CONFIG_CASTS: Dict[str, object] = {
+    "AUTOLOCK_MINUTES": int,
+    "KDF_N": int,
+    "KDF_R": int,
+    "KDF_P": int,
+    "KDF_DKLEN": int,
+    "MIN_MASTER_PW_LEN": int,
+    "BACKUP_KEEP": int,
+    "BACKUPS_ENABLED": bool,
+    "SAFE_CLI_DEFAULT": bool,
+    "ARGON2_TIME": int,
+    "ARGON2_MEMORY": int,
+    "ARGON2_PARALLELISM": int,
+    "AUDIT_ENABLED": bool,
+    "AUDIT_LOG_FILE": str,
+    "CLI_COLOR_ENABLED": bool,
+    "CLI_BG_COLOR": str,
+    "CLI_FG_COLOR": str,
+    "GUI_BG_COLOR": str,
+    "GUI_FG_COLOR": str,
+    "GUI_BUTTON_COLOR": str,
+    # Leerer String schaltet auf Auto-Erkennung der Sprache.
+    "FORCE_LANG": str,
+    # Optionaler Pfad zu einer Schlüsseldatei; leer deaktiviert das Keyfile.
+    "KEYFILE_PATH": str,
+    # Striktes Keyfile: bestimmt, ob ein gesetztes Keyfile zwingend vorhanden sein muss.
+    "REQUIRE_KEYFILE": bool,
+    # Steuerung für die Anzeige der Telegram-Werbung
+    "SHOW_TELEGRAM_AD": bool,
+    # Steuerung für den Hell/Dunkel-Button
+    "SHOW_LIGHT_DARK_TOGGLE": bool,
+}
+
+_CONFIG_HANDLERS: Dict[str, object] = {
+    "KDF_MODE": _apply_kdf_mode,
+    "ROTATION_WARNING_DAYS": _apply_rotation_warning_days,
+    "AUTO_ROTATION_DAYS": _apply_auto_rotation_days,
+    "MIN_VAULT_SIZE_KB": _apply_min_vault_size_kb,
+    "RECENT_VAULTS": _apply_recent_vaults,
+    "RECENT_VAULTS_MAX": _apply_recent_vaults_max,
+    "EXTRA_ENCRYPTION_LAYERS": _apply_extra_encryption_layers,
+    "DEVICE_BIND": _apply_device_bind,
+}
+
 def apply_config(cfg: Dict[str, object]) -> None:
     """
     Übernimmt die Werte aus ``cfg`` in die globalen Konfigurationsvariablen.
@@ -1175,189 +1404,21 @@ def apply_config(cfg: Dict[str, object]) -> None:
     kryptographischer Parameter (KDF_*) nicht rückwirkend auf bestehende
     Tresore wirken, sondern nur für neu angelegte Tresore gelten.
     """
-    global AUTOLOCK_MINUTES, KDF_N, KDF_R, KDF_P, KDF_DKLEN, MIN_MASTER_PW_LEN, BACKUP_KEEP, BACKUPS_ENABLED, SAFE_CLI_DEFAULT
     for key, value in cfg.items():
-        if key == "AUTOLOCK_MINUTES":
-            AUTOLOCK_MINUTES = int(value)
-        elif key == "KDF_N":
-            KDF_N = int(value)
-        elif key == "KDF_R":
-            KDF_R = int(value)
-        elif key == "KDF_P":
-            KDF_P = int(value)
-        elif key == "KDF_DKLEN":
-            KDF_DKLEN = int(value)
-        elif key == "MIN_MASTER_PW_LEN":
-            MIN_MASTER_PW_LEN = int(value)
-        elif key == "BACKUP_KEEP":
-            BACKUP_KEEP = int(value)
-        elif key == "BACKUPS_ENABLED":
-            BACKUPS_ENABLED = bool(value)
-        elif key == "SAFE_CLI_DEFAULT":
-            SAFE_CLI_DEFAULT = bool(value)
-        elif key == "KDF_MODE":
-            # Nur 'scrypt' oder 'argon2' zulassen
-            if str(value).lower() in ("scrypt", "argon2"):
-                globals()["KDF_MODE"] = str(value).lower()
-        elif key == "ARGON2_TIME":
-            globals()["ARGON2_TIME"] = int(value)
-        elif key == "ARGON2_MEMORY":
-            globals()["ARGON2_MEMORY"] = int(value)
-        elif key == "ARGON2_PARALLELISM":
-            globals()["ARGON2_PARALLELISM"] = int(value)
-        elif key == "AUDIT_ENABLED":
-            globals()["AUDIT_ENABLED"] = bool(value)
-        elif key == "AUDIT_LOG_FILE":
-            globals()["AUDIT_LOG_FILE"] = str(value)
-        elif key == "CLI_COLOR_ENABLED":
-            globals()["CLI_COLOR_ENABLED"] = bool(value)
-        elif key == "CLI_BG_COLOR":
-            globals()["CLI_BG_COLOR"] = str(value)
-        elif key == "CLI_FG_COLOR":
-            globals()["CLI_FG_COLOR"] = str(value)
-        elif key == "GUI_BG_COLOR":
-            globals()["GUI_BG_COLOR"] = str(value)
-        elif key == "GUI_FG_COLOR":
-            globals()["GUI_FG_COLOR"] = str(value)
-        elif key == "GUI_BUTTON_COLOR":
-            globals()["GUI_BUTTON_COLOR"] = str(value)
-        elif key == "ROTATION_WARNING_DAYS":
-            try:
-                days = int(value)
-            except Exception:
-                days = 0
-            globals()["ROTATION_WARNING_DAYS"] = max(0, days)
-        elif key == "AUTO_ROTATION_DAYS":
-            # Auto-Rotation: akzeptiere Ganzzahlen oder Fließkommazahlen, 0 = deaktiviert
-            try:
-                days = float(value)
-            except Exception:
-                days = 0
-            globals()["AUTO_ROTATION_DAYS"] = max(0, days)
-        elif key == "MIN_VAULT_SIZE_KB":
-            # Mindestgröße des Tresors in KiB. Negative Werte werden als 0 behandelt.
-            try:
-                size = int(value)
-            except Exception:
-                size = 0
-            globals()["MIN_VAULT_SIZE_KB"] = max(0, size)
-        elif key == "FORCE_LANG":
-            # Übernehme Sprache aus der Konfiguration. Leerer String schaltet auf Auto-Erkennung.
+        handler = _CONFIG_HANDLERS.get(key)
+        if handler is not None:
             try:
-                globals()["FORCE_LANG"] = str(value)
-            except Exception:
-                globals()["FORCE_LANG"] = ""
-        elif key == "RECENT_VAULTS":
-            # Lese Liste zuletzt verwendeter Tresor‑Pfade. Akzeptiere nur Listen von Strings.
-            try:
-                if isinstance(value, list):
-                    seen = []
-                    for itm in value:
-                        s = str(itm)
-                        if s and s not in seen:
-                            seen.append(s)
-                    # Begrenzt auf RECENT_VAULTS_MAX, falls gesetzt
-                    try:
-                        maxn = int(globals().get("RECENT_VAULTS_MAX", len(seen)))
-                    except Exception:
-                        maxn = len(seen)
-                    globals()["RECENT_VAULTS"] = seen[:maxn]
+                handler(value)
             except Exception:
                 pass
-        elif key == "RECENT_VAULTS_MAX":
-            # Setze die maximale Anzahl gespeicherter Tresore und kürze die Liste falls nötig
+            continue
+        cast = _CONFIG_CASTS.get(key)
+        if cast is not None:
             try:
-                n = int(value)
-                if n < 1:
-                    n = 1
-                globals()["RECENT_VAULTS_MAX"] = n
-                # Kürze bestehende Liste
-                if isinstance(globals().get("RECENT_VAULTS"), list):
-                    globals()["RECENT_VAULTS"] = globals()["RECENT_VAULTS"][:n]
+                globals()[key] = cast(value)
             except Exception:
                 pass
-        elif key == "SHOW_TELEGRAM_AD":
-            # Steuerung für die Anzeige der Telegram-Werbung
-            try:
-                globals()["SHOW_TELEGRAM_AD"] = bool(value)
-            except Exception:
-                globals()["SHOW_TELEGRAM_AD"] = True
-        elif key == "SHOW_LIGHT_DARK_TOGGLE":
-            # Steuerung für den Hell/Dunkel-Button
-            try:
-                globals()["SHOW_LIGHT_DARK_TOGGLE"] = bool(value)
-            except Exception:
-                globals()["SHOW_LIGHT_DARK_TOGGLE"] = False
-        elif key == "EXTRA_ENCRYPTION_LAYERS":
-            # Anzahl der zusätzlichen Verschlüsselungsschichten
-            try:
-                layers = int(value)
 
-            except Exception:
-                layers = 0
-            # Stelle sicher, dass nur nicht-negative Werte erlaubt sind
-            layers = max(0, layers)
-            globals()["EXTRA_ENCRYPTION_LAYERS"] = layers
-            # Aktualisiere die Dateiformat-Version entsprechend (Basis 3)
-            globals()["VERSION"] = 3 + layers
-            # Soft‑Warnung bei sehr vielen Schichten: Ab ~20 Schichten wird die Verarbeitung träge
-            try:
-                if layers > 20:
-                    warn_msg = tr(
-                        "WARNUNG: EXTRA_ENCRYPTION_LAYERS > 20 – Speichern und Laden kann sehr langsam werden.",
-                        "WARNING: EXTRA_ENCRYPTION_LAYERS > 20 – saving and loading might be very slow."
-                    )
-                    try:
-                        # Warnung in der CLI ausgeben
-                        print(warn_msg)
-                    except Exception:
-                        pass
-                    try:
-                        # Wenn eine GUI aktiv ist, zusätzlich Dialog anzeigen
-                        from tkinter import messagebox  # lokaler Import, falls tkinter verfügbar ist
-                        messagebox.showwarning(tr("Zusätzliche Schichten", "Additional layers"), warn_msg)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-        elif key == "KEYFILE_PATH":
-            # Optionaler Pfad zu einer Schlüsseldatei. Ein leerer Wert deaktiviert die Nutzung des Keyfiles.
-            try:
-                globals()["KEYFILE_PATH"] = str(value)
-            except Exception:
-                # Bei ungültigen Typen belasse den vorhandenen Wert
-                pass
-        elif key == "DEVICE_BIND":
-            # Aktiviere oder deaktiviere die Bindung an das aktuelle Gerät
-            try:
-                # Merke den alten Wert, um Änderungen zu erkennen
-                old_bind = bool(globals().get("DEVICE_BIND", False))
-                new_bind = bool(value)
-                globals()["DEVICE_BIND"] = new_bind
-                # Bei Aktivierung erstmals: deutliche Warnung ausgeben, da bestehende Tresore
-                # nicht mehr geöffnet werden können, solange sie nicht neu verschlüsselt wurden.
-                if (not old_bind) and new_bind:
-                    warn_msg = tr(
-                        "Gerätebindung aktiviert. Nur für neu erstellte Tresore; bestehende Tresore müssen vor Aktivierung neu verschlüsselt werden.",
-                        "Device binding enabled. Only applies to newly created vaults; existing vaults must be re‑encrypted before enabling this option."
-                    )
-                    try:
-                        print(warn_msg)
-                    except Exception:
-                        pass
-                    try:
-                        from tkinter import messagebox  # lokaler Import, falls tkinter verfügbar ist
-                        messagebox.showwarning(tr("Gerätebindung", "Device binding"), warn_msg)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-        elif key == "REQUIRE_KEYFILE":
-            # Striktes Keyfile: bestimmt, ob ein gesetztes Keyfile zwingend vorhanden sein muss.
-            try:
-                globals()["REQUIRE_KEYFILE"] = bool(value)
-            except Exception:
-                pass
 # Programmversionsnummer (für Anzeige oder interne Zwecke).
 # Diese Version beschreibt die aktuelle Version dieses Skripts und kann bei
 # zukünftigen Änderungen erhöht werden. Sie ist unabhängig von der
@@ -1388,20 +1449,18 @@ PROGRAM_VERSION = "3.0.0"
 # SECTION B — Abhängigkeitsprüfung
 # ====================================
 REQUIRED = ["cryptography"]
-OPTIONAL = ["pyperclip"]  # optional für CLI clipboard
+OPTIONAL = ["pyperclip", "orjson"]  # optional: CLI clipboard, schnellere JSON-Serialisierung
 
 def ensure_dependencies(interactive: bool = True) -> None:
     """
     Prüft ob benötigte Pakete vorhanden sind. Falls nicht und interactive=True wird
     gefragt, ob pip installiert werden soll. Bei 'Nein' wird das Programm abgebrochen.
     """
-    import importlib
-    missing = []
-    for pkg in REQUIRED:
-        try:
-            importlib.import_module(pkg)
-        except ImportError:
-            missing.append(pkg)
+    # find_spec prüft nur die Importierbarkeit, ohne das Paket auszuführen —
+    # ein voller Import von 'cryptography' würde hier bereits die
+    # OpenSSL-Bindings initialisieren, die wir gerade lazy halten.
+    from importlib.util import find_spec
+    missing = [pkg for pkg in REQUIRED if find_spec(pkg) is None]
     if missing:
         # Liste fehlender Pakete übersetzen
         print(
@@ -1458,25 +1517,53 @@ def ensure_dependencies(interactive: bool = True) -> None:
 # Run the check (interactive)
 # # ensure_dependencies(interactive=True)  # entfernt: keine Auto-Installation beim Import  # entfernt: keine Auto-Installation beim Import
 
-# Now safe to import cryptography primitives
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
-
-# Optional import: try to use cryptography's Scrypt implementation when available.
-# On systems where ``cryptography`` is not installed or cannot be installed
-# (e.g. offline environments), we fall back to ``hashlib.scrypt`` with an
-# increased ``maxmem`` parameter to avoid the default OpenSSL memory limit.
-try:
-    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt as _CryptoScrypt
-except Exception:
-    _CryptoScrypt = None
-
-# Optional import: Argon2 KDF (via argon2-cffi). Wenn nicht vorhanden,
-# kann dennoch die scrypt-KDF verwendet werden.
-try:
-    from argon2.low_level import hash_secret_raw, Type as _Argon2Type
-    _HAS_ARGON2 = True
-except Exception:
-    _HAS_ARGON2 = False
+# Die Krypto-Backends werden erst beim ersten Tresor-Zugriff geladen.
+# ``cryptography`` zieht die OpenSSL-Bindings, ``argon2-cffi`` eine
+# C-Extension — beides kostet beim Import spürbar Zeit, die reine
+# Konfig-/Hilfe-Aufrufe nicht bezahlen müssen. _load_crypto() füllt die
+# folgenden Platzhalter beim ersten Aufruf und ist danach ein No-Op.
+AESGCM = None
+ChaCha20Poly1305 = None
+_CryptoScrypt = None
+hash_secret_raw = None
+_Argon2Type = None
+_HAS_ARGON2 = False
+_CRYPTO_LOADED = False
+
+def _load_crypto() -> None:
+    """
+    Importiert die AEAD-Primitiven und optionalen KDF-Backends beim ersten
+    Bedarf. ``cryptography`` ist Pflicht und löst bei Fehlen einen
+    ImportError aus; die Scrypt-Klasse des Pakets und ``argon2-cffi``
+    bleiben wie bisher optional.
+    """
+    global AESGCM, ChaCha20Poly1305, _CryptoScrypt
+    global hash_secret_raw, _Argon2Type, _HAS_ARGON2, _CRYPTO_LOADED
+    if _CRYPTO_LOADED:
+        return
+    from cryptography.hazmat.primitives.ciphers.aead import (
+        AESGCM as _aesgcm_cls,
+        ChaCha20Poly1305 as _chacha_cls,
+    )
+    AESGCM = _aesgcm_cls
+    ChaCha20Poly1305 = _chacha_cls
+    # Optional: Scrypt-Implementierung des cryptography-Pakets als Fallback,
+    # falls hashlib.scrypt nicht verfügbar ist (Python-Build ohne OpenSSL 1.1+).
+    try:
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt as _scrypt_cls
+        _CryptoScrypt = _scrypt_cls
+    except Exception:
+        _CryptoScrypt = None
+    # Optional: Argon2 KDF (via argon2-cffi). Wenn nicht vorhanden,
+    # kann dennoch die scrypt-KDF verwendet werden.
+    try:
+        from argon2.low_level import hash_secret_raw as _hsr, Type as _argon2_type
+        hash_secret_raw = _hsr
+        _Argon2Type = _argon2_type
+        _HAS_ARGON2 = True
+    except Exception:
+        _HAS_ARGON2 = False
+    _CRYPTO_LOADED = True
 
 # optional pyperclip for CLI clipboard support
 try:
@@ -1485,12 +1572,35 @@ try:
 except Exception:
     _HAS_PYPERCLIP = False
 
+# optional orjson für deutlich schnellere JSON-(De-)Serialisierung des
+# Tresors. Ohne das Paket wird die Standardbibliothek verwendet.
+try:
+    import orjson as _orjson
+    _HAS_ORJSON = True
+except Exception:
+    _orjson = None
+    _HAS_ORJSON = False
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialisiert ``obj`` zu UTF-8-JSON-Bytes; nutzt orjson, falls vorhanden."""
+    if _HAS_ORJSON:
+        return _orjson.dumps(obj)
+    # Kompakte Separatoren wie bei orjson: kein ": "/", "-Füllraum, der
+    # anschließend mitverschlüsselt und mit-gehasht würde.
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(data: bytes):
+    """Parst UTF-8-JSON-Bytes; nutzt orjson, falls vorhanden."""
+    if _HAS_ORJSON:
+        return _orjson.loads(data)
+    return json.loads(data)
+
 # Try import tkinter lazily later
 
 # ====================================
 # SECTION C — Dataclasses und Hilfsfunktionen
 # ====================================
-@dataclass
+@dataclass(slots=True)
 class Entry:
     """Ein einzelner Passwort-Eintrag innerhalb des Tresors.
 
@@ -1516,7 +1626,7 @@ class Entry:
     # gemeinsam mit dem Eintrag verschlüsselt gespeichert.
     attachments: List[Dict[str, str]] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Vault:
     entries: Dict[str, Entry]
     created_at: float
@@ -1527,25 +1637,40 @@ class Vault:
         now = time.time()
         return Vault(entries={}, created_at=now, updated_at=now)
 
+# Feldnamen von Entry für die flache Serialisierung in save_vault; mit
+# slots=True gibt es kein __dict__ mehr, die Reihenfolge entspricht der
+# Felddeklaration.
+_ENTRY_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in dataclass_fields(Entry))
+
+@functools.cache
 def exe_dir() -> Path:
-    """Verzeichnis der laufenden Datei (Script oder EXE)."""
+    """Verzeichnis der laufenden Datei (Script oder EXE). Das Ergebnis ist
+    für die Prozesslaufzeit konstant und wird gecacht (resolve() löst sonst
+    bei jedem Aufruf eine readlink/lstat-Kette aus)."""
     if getattr(sys, "frozen", False):
         return Path(sys.executable).resolve().parent
     return Path(__file__).resolve().parent
 
+@functools.cache
 def default_vault_path() -> Path:
     return exe_dir() / DEFAULT_VAULT_NAME
 
+# Alles außer den erlaubten Dateinamen-Zeichen wird entfernt; ein
+# vorkompilierter C-Level-Regex ersetzt den Python-Filter pro Zeichen.
+_SAFE_FILENAME_RE = re.compile(r"[^-_.() A-Za-z0-9]+")
+
 def safe_filename(name: str) -> str:
     """Erzeugt einen Dateinamen-freundlichen String aus 'name'."""
-    allowed = "-_.() %s%s" % (string.ascii_letters, string.digits)
-    filtered = ''.join(c for c in name if c in allowed)
-    return filtered[:120] or "export"
+    return _SAFE_FILENAME_RE.sub("", name)[:120] or "export"
+
+# Zeichenvorrat für generierte Passwörter, einmal auf Modulebene angelegt.
+_PW_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$_-+.^*?"
 
 def generate_password(length: int = 20) -> str:
     """Erzeugt ein starkes Passwort mit sicheren Zufallszahlen."""
-    chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$_-+.^*?"
-    return ''.join(secrets.choice(chars) for _ in range(max(8, min(128, length))))
+    # List-Comprehension statt Generator: str.join kann die Länge vorab
+    # bestimmen. secrets.choice bleibt für die gleichverteilte Auswahl.
+    return ''.join([secrets.choice(_PW_CHARS) for _ in range(max(8, min(128, length)))])
 
 # ---------------------------------------------------------------
 # Passphrase‑Generator
@@ -1710,9 +1835,13 @@ def generate_entry_id(existing: Dict[str, Entry]) -> str:
     Returns: eine eindeutige kurze ID.
     """
     while True:
-        new_id = secrets.token_hex(3)  # 6 Hex-Zeichen
-        if new_id not in existing:
-            return new_id
+        # Ein urandom-Aufruf liefert 64 Kandidaten (je 3 Bytes = 6 Hex-Zeichen);
+        # erst wenn alle kollidieren, wird nachgezogen.
+        buf = os.urandom(64 * 3)
+        for i in range(0, len(buf), 3):
+            new_id = buf[i:i + 3].hex()
+            if new_id not in existing:
+                return new_id
 
 # Audit-Logging-Funktion
 
@@ -1723,50 +1852,174 @@ def _ensure_file_0600(path: str) -> None:
     except Exception:
         pass
 
-def _rotate_audit_if_needed(path: str) -> None:
-    try:
-        if not os.path.exists(path):
+AUDIT_BATCH_SIZE = 64          # max. Einträge pro Sammel-Write
+AUDIT_FLUSH_INTERVAL = 0.05    # Sekunden, die auf weitere Einträge gewartet wird
+
+class _AuditWriter:
+    """
+    Gepufferter Audit-Log-Writer. Statt pro Ereignis die Datei zu öffnen,
+    zu schreiben und wieder zu schließen (~5 Syscalls je Zeile), hält ein
+    Hintergrund-Thread einen dauerhaften O_APPEND-Deskriptor und schreibt
+    mehrere Einträge gesammelt mit einem einzigen os.write. Die Rotation
+    läuft nur noch an Batch-Grenzen. Der Thread startet lazy beim ersten
+    Ereignis und beendet sich mit dem Prozess (daemon=True); beim Beenden
+    werden ausstehende Einträge best-effort nachgeschrieben.
+    """
+
+    def __init__(self) -> None:
+        self._q: "queue.Queue[bytes]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._fd = -1
+        self._path: Optional[str] = None
+        # Mitgeführte Dateigröße: einmal per fstat beim Öffnen ermittelt,
+        # danach pro Write fortgeschrieben — erspart den stat-Syscall, den
+        # die Rotationsprüfung sonst pro Batch bräuchte.
+        self._size = 0
+        # Wird von drain() gesetzt: der Worker verzichtet dann auf das
+        # Batching-Warten und schreibt nur noch weg, was schon anliegt.
+        self._draining = False
+
+    def put(self, line: bytes) -> None:
+        self._ensure_thread()
+        self._q.put_nowait(line)
+
+    def _ensure_thread(self) -> None:
+        t = self._thread
+        if t is not None and t.is_alive():
             return
-        size = os.path.getsize(path)
-        if AUDIT_MAX_BYTES and size > int(AUDIT_MAX_BYTES):
-            # rotiere: audit.log -> audit.log.1, ..., .N
-            for i in range(AUDIT_BACKUPS_TO_KEEP - 1, 0, -1):
-                older = f"{path}.{i}"
-                newer = f"{path}.{i+1}"
-                if os.path.exists(older):
-                    try:
-                        os.replace(older, newer)
-                    except Exception:
-                        pass
+        with self._thread_lock:
+            t = self._thread
+            if t is None or not t.is_alive():
+                t = threading.Thread(target=self._run, daemon=True, name="wlk-audit")
+                self._thread = t
+                t.start()
+
+    def _open(self, path: str) -> None:
+        # O_CLOEXEC: der dauerhafte Log-Deskriptor darf nicht in
+        # Kindprozesse (z. B. xdg-open/pbcopy-Aufrufe) wandern.
+        # O_NOFOLLOW: das Append-Log soll nicht über einen Symlink
+        # umgeleitet werden können.
+        flags = (os.O_WRONLY | os.O_CREAT | os.O_APPEND
+                 | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_NOFOLLOW", 0))
+        mode = 0o600 if os.name == "posix" else 0o666
+        self._fd = os.open(path, flags, mode)
+        self._path = path
+        try:
+            self._size = os.fstat(self._fd).st_size
+        except Exception:
+            self._size = 0
+        _ensure_file_0600(path)
+
+    def _close(self) -> None:
+        if self._fd >= 0:
             try:
-                os.replace(path, f"{path}.1")
+                os.close(self._fd)
             except Exception:
                 pass
-    except Exception:
-        pass
+        self._fd = -1
+
+    def _rotate_if_needed(self) -> None:
+        # Rotation an Batch-Grenzen: audit.log -> audit.log.1, ..., .N
+        path = self._path
+        if not path:
+            return
+        if not (AUDIT_MAX_BYTES and self._size > int(AUDIT_MAX_BYTES)):
+            return
+        self._close()
+        # Kein exists-Probe vor dem Umbenennen: os.replace meldet eine
+        # fehlende Quelle selbst per FileNotFoundError.
+        for i in range(AUDIT_BACKUPS_TO_KEEP - 1, 0, -1):
+            try:
+                os.replace(f"{path}.{i}", f"{path}.{i+1}")
+            except FileNotFoundError:
+                pass
+            except Exception:
+                pass
+        try:
+            os.replace(path, f"{path}.1")
+        except Exception:
+            pass
+
+    def _write_batch(self, data: bytes) -> None:
+        # Konfig kann AUDIT_LOG_FILE zur Laufzeit ändern: bei Pfadwechsel
+        # oder nach einer Rotation neu öffnen.
+        path = str(AUDIT_LOG_FILE)
+        if self._fd < 0 or path != self._path:
+            self._close()
+            self._open(path)
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            self._size += written
+            view = view[written:]
+        self._rotate_if_needed()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._q.get()]
+            try:
+                # Beim Drain nicht mehr auf Nachzügler warten, sonst stirbt
+                # der Daemon-Thread mitten im Flush-Fenster und der letzte
+                # Batch geht verloren.
+                deadline = time.monotonic() + (
+                    0.0 if self._draining else AUDIT_FLUSH_INTERVAL)
+                while len(batch) < AUDIT_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        if remaining > 0:
+                            batch.append(self._q.get(timeout=remaining))
+                        else:
+                            batch.append(self._q.get_nowait())
+                    except queue.Empty:
+                        break
+                self._write_batch(b"".join(batch))
+            except Exception:
+                # niemals die App stoppen
+                pass
+            finally:
+                # task_done erst NACH dem Write: drain() verlässt sich
+                # darauf, dass unerledigte Einträge auch die gerade in
+                # Arbeit befindlichen umfassen, nicht nur die Queue-Länge.
+                for _ in batch:
+                    try:
+                        self._q.task_done()
+                    except Exception:
+                        pass
+
+    def drain(self, timeout: float = 1.0) -> None:
+        """
+        Wartet best-effort, bis alle übergebenen Einträge geschrieben sind.
+        Zählt über task_done auch Einträge mit, die der Worker bereits aus
+        der Queue genommen, aber noch nicht geschrieben hat — ein reiner
+        empty()-Test würde genau den letzten Batch jeder Sitzung verlieren.
+        """
+        self._draining = True
+        deadline = time.monotonic() + timeout
+        with self._q.all_tasks_done:
+            while self._q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._q.all_tasks_done.wait(remaining)
+
+_AUDIT_WRITER = _AuditWriter()
+atexit.register(_AUDIT_WRITER.drain)
 
 def write_audit(action: str, details: str) -> None:
     """
     Gesichertes Audit-Log mit Rechtesetzung (0600), optionaler Redaction und Rotation.
+    Die Zeile wird an den gepufferten Writer übergeben; geschrieben wird
+    asynchron in Batches.
     """
     if not AUDIT_ENABLED:
         return
     try:
-        _rotate_audit_if_needed(AUDIT_LOG_FILE)
         red = details
         if AUDIT_REDACT:
             # nur Hash statt Inhalt schreiben
             red = hashlib.sha256(details.encode("utf-8")).hexdigest()[:16]
-        line = f"{time.time()}|{action}|{red}\n"
-        # Öffnen + Rechte
-        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
-        mode = 0o600 if os.name == "posix" else 0o666
-        fd = os.open(AUDIT_LOG_FILE, flags, mode)
-        try:
-            with os.fdopen(fd, "a", encoding="utf-8", newline="\n") as f:
-                f.write(line)
-        finally:
-            _ensure_file_0600(AUDIT_LOG_FILE)
+        _AUDIT_WRITER.put(f"{time.time()}|{action}|{red}\n".encode("utf-8"))
     except Exception:
         # niemals die App stoppen
         pass
@@ -1774,15 +2027,43 @@ def write_audit(action: str, details: str) -> None:
 # SECTION C1 — CLI Status Informationen
 # ====================================
 
+def _secure_open_write(path: Path, newline: bool = False):
+    """
+    Öffnet ``path`` zum Schreiben von Text mit restriktiven Rechten
+    (POSIX 0600) und 64-KiB-Puffer. Für Exporte, die ihre Ausgabe
+    stückweise erzeugen, statt sie erst komplett im Speicher aufzubauen.
+    """
+    path = Path(path)
+    if os.name == "posix":
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0), 0o600)
+        try:
+            return open(fd, "w", encoding="utf-8", buffering=64 * 1024,
+                        newline="\n" if newline else None)
+        except Exception:
+            os.close(fd)
+            raise
+    return open(path, "w", encoding="utf-8", buffering=64 * 1024,
+                newline="\n" if newline else None)
+
 def _secure_write_text(path: Path, text: str, newline: bool=False):
     """
     Schreibt Text mit restriktiven Rechten (POSIX 0600). Auf Windows ohne POSIX-Rechte.
     """
     path = Path(path)
     if os.name == "posix":
-        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        with os.fdopen(fd, "w", encoding="utf-8", newline="\n" if newline else None) as f:
-            f.write(text)
+        # Einmal kodieren und direkt per os.write schreiben; der
+        # TextIOWrapper (Puffer, Encoder, Newline-Übersetzung) ist für
+        # einen One-Shot-Write nur Overhead. Auf POSIX schreibt 'w' ohne
+        # newline-Argument ohnehin "\n" unverändert.
+        data = text.encode("utf-8")
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0), 0o600)
+        try:
+            mv = memoryview(data)
+            while mv:
+                written = os.write(fd, mv)
+                mv = mv[written:]
+        finally:
+            os.close(fd)
         try:
             os.chmod(str(path), 0o600)
         except Exception:
@@ -1881,7 +2162,16 @@ def print_cli_status(path: Path) -> None:
 # ------------------------------------
 # SECTION C2 — Schlüsselrotations-Warnungen
 # ------------------------------------
-def maybe_warn_rotation(vault: Vault) -> Optional[str]:
+def _vault_age_days(vault: Vault) -> float:
+    """
+    Liefert das Alter des Tresors in Tagen seit dem letzten Speichern
+    (``vault.updated_at``). Wird von den Rotationsprüfungen gemeinsam
+    genutzt, damit CLI und GUI den Zeitstempel nur einmal pro Aufruf
+    berechnen müssen.
+    """
+    return (time.time() - (vault.updated_at or 0)) / 86400.0
+
+def maybe_warn_rotation(vault: Vault, age_days: Optional[float] = None) -> Optional[str]:
     """
     Prüft, ob der Tresor seit einer konfigurierten Zeit (``ROTATION_WARNING_DAYS``)
     nicht mehr gespeichert wurde. Wenn die Differenz zwischen dem aktuellen
@@ -1892,6 +2182,8 @@ def maybe_warn_rotation(vault: Vault) -> Optional[str]:
     gewarnt.
 
     ``vault``: Das geöffnete Vault-Objekt.
+    ``age_days``: Optional vorberechnetes Alter aus ``_vault_age_days``,
+    damit Aufrufer mehrere Prüfungen mit demselben Wert speisen können.
     Returns: Ein Warnhinweis als String oder ``None``, wenn keine
     Rotation notwendig ist.
     """
@@ -1901,7 +2193,7 @@ def maybe_warn_rotation(vault: Vault) -> Optional[str]:
             return None
         last_update = vault.updated_at or 0
         # Berechne vergangene Tage seit dem letzten Update
-        days_since = (time.time() - last_update) / 86400.0
+        days_since = _vault_age_days(vault) if age_days is None else age_days
         if days_since >= threshold_days:
             # Formatierbares Datum des letzten Updates
             ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_update))
@@ -1915,7 +2207,7 @@ def maybe_warn_rotation(vault: Vault) -> Optional[str]:
         pass
     return None
 
-def maybe_warn_rotation_cli(vault: Vault) -> None:
+def maybe_warn_rotation_cli(vault: Vault, age_days: Optional[float] = None) -> None:
     """
     Gibt eine Warnung zur Schlüsselrotation im CLI aus, falls ``maybe_warn_rotation``
     einen Hinweis zurückliefert. Wenn keine Warnung notwendig ist, geschieht
@@ -1923,11 +2215,11 @@ def maybe_warn_rotation_cli(vault: Vault) -> None:
     konkreten Ausgabe, sodass sie sowohl in CLI als auch in der GUI
     verwendet werden kann.
     """
-    msg = maybe_warn_rotation(vault)
+    msg = maybe_warn_rotation(vault, age_days)
     if msg:
         print("\n" + msg + "\n")
 
-def maybe_warn_rotation_gui(vault: Vault) -> None:
+def maybe_warn_rotation_gui(vault: Vault, age_days: Optional[float] = None) -> None:
     """
     Zeigt eine Warnung zur Schlüsselrotation in der GUI an, falls
     ``maybe_warn_rotation`` einen Hinweis zurückliefert. Es wird ein
@@ -1935,7 +2227,7 @@ def maybe_warn_rotation_gui(vault: Vault) -> None:
     nichts angezeigt.
     """
     try:
-        msg = maybe_warn_rotation(vault)
+        msg = maybe_warn_rotation(vault, age_days)
         if msg:
             from tkinter import messagebox
             # Zeige Warnung zweisprachig. Der Titel wird in die aktuelle Sprache übersetzt.
@@ -1948,7 +2240,7 @@ def maybe_warn_rotation_gui(vault: Vault) -> None:
         pass
 
 
-def auto_rotate_if_due(path: Path, vault: Vault, master_pw_str: str) -> bool:
+def auto_rotate_if_due(path: Path, vault: Vault, master_pw_str: str, age_days: Optional[float] = None) -> bool:
     """
     Führt eine automatische Schlüsselrotation durch, wenn der Tresor älter
     ist als die in ``AUTO_ROTATION_DAYS`` konfigurierte Schwelle. Die
@@ -1961,6 +2253,7 @@ def auto_rotate_if_due(path: Path, vault: Vault, master_pw_str: str) -> bool:
         path: Pfad der Tresor-Datei.
         vault: Geladenes Vault-Objekt.
         master_pw_str: Das Master-Passwort als Klartext-String.
+        age_days: Optional vorberechnetes Alter aus ``_vault_age_days``.
 
     Returns:
         True, wenn eine Rotation durchgeführt wurde, ansonsten False.
@@ -1970,8 +2263,8 @@ def auto_rotate_if_due(path: Path, vault: Vault, master_pw_str: str) -> bool:
         if not isinstance(days, (int, float)) or days <= 0:
             return False
         # Wieviel Zeit seit letzter Aktualisierung?
-        last = vault.updated_at or 0
-        age_days = (time.time() - last) / 86400.0
+        if age_days is None:
+            age_days = _vault_age_days(vault)
         if age_days >= days:
             # Tresor neu verschlüsseln (ohne Backup, um unnötige Kopien zu vermeiden)
             save_vault(path, vault, master_pw_str, make_backup=False)
@@ -1994,25 +2287,199 @@ def auto_rotate_if_due(path: Path, vault: Vault, master_pw_str: str) -> bool:
 # ====================================
 # SECTION D — Kryptographische Hilfsfunktionen
 # ====================================
+def _scrypt_raw(password: bytes, salt: bytes, n: int, r: int, p: int, dklen: int) -> bytes:
+    """
+    Führt die scrypt‑KDF über die OpenSSL‑gebundene ``hashlib.scrypt`` aus.
+
+    ``hashlib.scrypt`` ruft direkt die vektorisierte OpenSSL‑Implementierung
+    auf und ist damit die schnellste verfügbare Variante. Das
+    Standard‑Speicherlimit von OpenSSL (ca. 32 MiB) wird über ``maxmem``
+    angehoben, damit auch große ``n``‑Parameter funktionieren; als
+    Obergrenze gelten 256 MiB. Nur wenn ``hashlib.scrypt`` nicht verfügbar
+    ist (Python‑Build ohne OpenSSL 1.1+), wird auf die
+    Scrypt‑Implementierung des ``cryptography``‑Pakets zurückgegriffen.
+    """
+    required = 128 * n * r * p
+    MAX_SCRYPT_MAXMEM = 256 * 1024 * 1024  # 256 MiB Cap
+    maxmem = min(required * 2 + 2 ** 25, MAX_SCRYPT_MAXMEM)
+    if maxmem < required * 2:
+        raise RuntimeError(
+            "Scrypt-Parameter überschreiten das Speicherlimit (256 MiB). "
+            "Bitte KDF-Parameter in der Konfig reduzieren."
+        )
+    if hasattr(hashlib, "scrypt"):
+        return hashlib.scrypt(
+            password=password,
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            dklen=dklen,
+            maxmem=maxmem,
+        )
+    _load_crypto()
+    if _CryptoScrypt is not None:
+        kdf = _CryptoScrypt(salt=salt, length=dklen, n=n, r=r, p=p)
+        return kdf.derive(password)
+    raise RuntimeError(
+        "Keine scrypt-Implementierung verfügbar. Bitte 'cryptography' installieren."
+    )
+
+# Einmalige scrypt-Kalibrierung. Statt die Kostenparameter blind fest zu
+# verdrahten, wird vor der ersten Verschlüsselung eine kurze Probe-Ableitung
+# gemessen und KDF_N so skaliert, dass eine Ableitung ungefähr die Zielzeit
+# erreicht. Die Kalibrierung läuft höchstens einmal pro Prozess, nur im
+# scrypt-Modus und nur, wenn die Konfiguration den Standardwert nicht
+# überschrieben hat. Entschlüsseln ist nicht betroffen, da die Parameter
+# eines Tresors aus dessen KDF-TLV gelesen werden.
+_KDF_N_DEFAULT = KDF_N
+_KDF_CALIBRATED = False
+
+def calibrate_kdf_params(target_ms: float = 250.0) -> None:
+    """
+    Misst eine scrypt-Probe-Ableitung und passt ``KDF_N`` an die Zielzeit an.
+
+    ``KDF_N`` wird in Zweierpotenzen hochskaliert, bis die extrapolierte
+    Dauer die Zielzeit erreicht. Untergrenze ist der bisherige Standard
+    (2**15), Obergrenze 2**17 (ca. 128 MiB Speicherbedarf). Fehler bei der
+    Messung lassen die Parameter unverändert.
+    """
+    global KDF_N, _KDF_CALIBRATED
+    if _KDF_CALIBRATED:
+        return
+    _KDF_CALIBRATED = True
+    # Nur den unveränderten Standard kalibrieren, explizite Konfig-Werte respektieren.
+    if KDF_N != _KDF_N_DEFAULT:
+        return
+    try:
+        probe_n = 2 ** 12
+        start = time.perf_counter()
+        _scrypt_raw(b"wlk-calibration", b"\x00" * SALT_LEN, probe_n, KDF_R, KDF_P, KDF_DKLEN)
+        dur = time.perf_counter() - start
+        if dur <= 0:
+            return
+        n = probe_n
+        while n < 2 ** 17 and dur * 2 <= target_ms / 1000.0:
+            n *= 2
+            dur *= 2
+        KDF_N = max(_KDF_N_DEFAULT, n)
+    except Exception:
+        # Kalibrierung ist best-effort; im Zweifel bleiben die Standardwerte.
+        pass
+
+# Standardwert von ARGON2_MEMORY (für die Erkennung von Konfig-Overrides,
+# analog zu _KDF_N_DEFAULT) sowie Merker für die einmalige Anpassung.
+_ARGON2_MEMORY_DEFAULT = 262144
+_ARGON2_MEMORY_CLAMPED = False
+
+def _available_memory_kib() -> int:
+    """
+    Bestimmt best-effort den verfügbaren Arbeitsspeicher in KiB. Unter
+    Linux wird ``MemAvailable`` aus /proc/meminfo gelesen; sonst dient die
+    Hälfte des physischen Gesamtspeichers (sysconf) als Näherung. 0 heißt
+    "unbekannt".
+    """
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])
+    except Exception:
+        pass
+    try:
+        pages = os.sysconf("SC_PHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return (pages * page_size) // 1024 // 2
+    except Exception:
+        return 0
+
+def resolve_argon2_parallelism() -> None:
+    """
+    Löst den Automatikwert ``ARGON2_PARALLELISM = 0`` einmalig auf: es
+    werden so viele Lanes wie CPU-Kerne verwendet (höchstens 8). Dabei
+    wird ``ARGON2_MEMORY`` auf die RFC-9106-Untergrenze von 8 MiB je Lane
+    angehoben. Mehr Lanes verteuern auch jeden Rateversuch eines
+    Angreifers entsprechend. Läuft wie die übrigen Anpassungen vor dem
+    Schreiben des KDF-TLV, damit Header und Ableitung übereinstimmen.
+    """
+    global ARGON2_PARALLELISM, ARGON2_MEMORY
+    try:
+        if int(ARGON2_PARALLELISM) > 0:
+            return
+        par = min(os.cpu_count() or 1, 8)
+        ARGON2_PARALLELISM = par
+        if ARGON2_MEMORY < par * 8192:
+            ARGON2_MEMORY = par * 8192
+    except Exception:
+        pass
+
+def clamp_argon2_memory() -> None:
+    """
+    Senkt ``ARGON2_MEMORY`` einmalig, wenn der Standardwert (256 MiB) den
+    verfügbaren Arbeitsspeicher zu stark belasten würde — sonst drückt
+    Swapping die Ableitung von Sekunden auf Minuten. Es wird höchstens ein
+    Viertel des verfügbaren Speichers belegt, mindestens aber 64 MiB.
+    Explizit konfigurierte Werte bleiben unangetastet; beim Entschlüsseln
+    gelten ohnehin die im Tresor-Header gespeicherten Parameter.
+    """
+    global ARGON2_MEMORY, _ARGON2_MEMORY_CLAMPED
+    if _ARGON2_MEMORY_CLAMPED:
+        return
+    _ARGON2_MEMORY_CLAMPED = True
+    if ARGON2_MEMORY != _ARGON2_MEMORY_DEFAULT:
+        return
+    try:
+        avail = _available_memory_kib()
+        if avail <= 0:
+            return
+        budget = max(65536, avail // 4)
+        if budget < ARGON2_MEMORY:
+            ARGON2_MEMORY = budget
+    except Exception:
+        # Anpassung ist best-effort; im Zweifel bleibt der Standardwert.
+        pass
+
+# Session-Cache für KDF-Ergebnisse. Argon2/scrypt brauchen pro Ableitung
+# bewusst viel Zeit; bei jedem Auto-Lock/Unlock-Zyklus mit identischem
+# Passwort, Salt und Parametern fiele die volle Wartezeit erneut an. Der
+# Cache hält die abgeleiteten Schlüssel für die Prozesslaufzeit (niemals
+# auf Platte) und wird beim Beenden geleert — dieselbe Lebensdauer, die
+# die Schlüssel im Speicher ohnehin hätten, solange der Tresor offen ist.
+_KDF_RESULT_CACHE: Dict[tuple, Tuple[bytes, bytes, bytes]] = {}
+_KDF_RESULT_CACHE_MAX = 4
+
+def clear_kdf_cache() -> None:
+    """Verwirft alle zwischengespeicherten KDF-Ergebnisse."""
+    _KDF_RESULT_CACHE.clear()
+
+atexit.register(clear_kdf_cache)
+
+def _kdf_cache_put(cache_key: tuple, keys: Tuple[bytes, bytes, bytes]) -> None:
+    if len(_KDF_RESULT_CACHE) >= _KDF_RESULT_CACHE_MAX:
+        _KDF_RESULT_CACHE.clear()
+    _KDF_RESULT_CACHE[cache_key] = keys
+
 def derive_three_keys(master_pw: bytes, salt: bytes) -> Tuple[bytes, bytes, bytes]:
     """
     Leitet drei unabhängige Schlüssel (AES‑Key, ChaCha‑Key und MAC‑Key) aus
     ``master_pw`` und ``salt`` ab. Normalerweise wird hierfür die
     standardmäßige scrypt‑KDF verwendet, die starke Parameter (``KDF_N``,
-    ``KDF_R``, ``KDF_P``) unterstützt. Allerdings begrenzt die
-    OpenSSL‑Implementierung von ``hashlib.scrypt`` die maximal zulässige
-    Speicherverwendung auf ca. 32 MiB, was bei den hier gewählten Parametern
-    zu einem ``ValueError: memory limit exceeded`` führen kann. Wenn das
-    ``cryptography``‑Paket verfügbar ist, verwenden wir dessen
-    Scrypt‑Implementierung, die ohne diese Beschränkung arbeitet. Ansonsten
-    berechnen wir die benötigte Speichermenge und erhöhen den
-    ``maxmem``‑Parameter von ``hashlib.scrypt`` entsprechend, um die
-    Ableitung dennoch zu ermöglichen.
+    ``KDF_R``, ``KDF_P``) unterstützt. Die eigentliche Ableitung übernimmt
+    ``_scrypt_raw``, das die OpenSSL‑gebundene ``hashlib.scrypt`` mit
+    angehobenem ``maxmem``‑Parameter aufruft und nur bei deren Fehlen auf
+    die Scrypt‑Implementierung des ``cryptography``‑Pakets zurückfällt.
 
     ``master_pw``: muss als bytes angegeben werden (wird später versucht zu
     überschreiben).
     Returns: Tupel (AES‑Schlüssel, ChaCha‑Schlüssel, MAC‑Schlüssel), je 32 Byte.
     """
+    _load_crypto()
+    # Automatikwert 0 für die Argon2-Lanes auflösen, bevor die Globals in
+    # Cache-Schlüssel oder KDF-Aufruf einfließen: auch Pfade ohne vorheriges
+    # Verschlüsseln (z. B. das Entsperren alter v2-Tresore) nutzen diese
+    # Funktion direkt.
+    if KDF_MODE == "argon2" and _HAS_ARGON2:
+        resolve_argon2_parallelism()
     # Bereite das Passwort vor: Keyfile und Geräte-Pepper einmischen.
     try:
         master_pw = _pre_kdf(master_pw)
@@ -2030,11 +2497,25 @@ def derive_three_keys(master_pw: bytes, salt: bytes) -> Tuple[bytes, bytes, byte
     # Optionale Verwendung von Argon2 anstelle von scrypt, wenn konfiguriert
     # und die Bibliothek vorhanden ist. Argon2 bietet eine moderne, speicherintensive
     # KDF. Die Parameter werden über die Konfiguration gesteuert.
-    if KDF_MODE == "argon2" and _HAS_ARGON2:
+    use_argon2 = KDF_MODE == "argon2" and _HAS_ARGON2
+    # Cache-Schlüssel aus Passwort-Hash, Salt und den wirksamen Parametern;
+    # das Passwort selbst landet nicht als Klartext im Schlüssel.
+    if use_argon2:
+        cache_key = (hashlib.sha512(master_pw).digest(), salt, "argon2",
+                     ARGON2_TIME, ARGON2_MEMORY, ARGON2_PARALLELISM, KDF_DKLEN)
+    else:
+        cache_key = (hashlib.sha512(master_pw).digest(), salt, "scrypt",
+                     KDF_N, KDF_R, KDF_P, KDF_DKLEN)
+    cached = _KDF_RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    if use_argon2:
         # memory_cost ist in Kibibytes. time_cost ist die Iterationsanzahl.
         # parallelism bestimmt die Anzahl Threads.
+        # argon2s FFI akzeptiert nur bytes; bytearray-Aufrufer (die das
+        # Passwort nach Gebrauch überschreiben wollen) hier einmalig kopieren.
         dk = hash_secret_raw(
-            secret=master_pw,
+            secret=bytes(master_pw),
             salt=salt,
             time_cost=ARGON2_TIME,
             memory_cost=ARGON2_MEMORY,
@@ -2043,37 +2524,9 @@ def derive_three_keys(master_pw: bytes, salt: bytes) -> Tuple[bytes, bytes, byte
             type=_Argon2Type.ID,
         )
     else:
-        # Verwende scrypt. Wenn cryptography's Scrypt verfügbar ist, verwenden
-        # wir diese Implementierung ohne Speicherbegrenzung. Ansonsten
-        # verwenden wir hashlib.scrypt mit erhöhtem maxmem.
-        if _CryptoScrypt is not None:
-            kdf = _CryptoScrypt(
-                salt=salt,
-                length=KDF_DKLEN,
-                n=KDF_N,
-                r=KDF_R,
-                p=KDF_P,
-            )
-            dk = kdf.derive(master_pw)
-        else:
-            # Fallback: hashlib.scrypt mit erhöhtem maxmem.
-            required = 128 * KDF_N * KDF_R * KDF_P
-            MAX_SCRYPT_MAXMEM = 256 * 1024 * 1024  # 256 MiB Cap
-            maxmem = min(required * 2, MAX_SCRYPT_MAXMEM)
-            if maxmem < required * 2:
-                raise RuntimeError(
-                    "Scrypt-Fallback nicht sicher (Speicherlimit). Bitte 'cryptography' installieren "
-                    "oder KDF‑Parameter in der Konfig reduzieren."
-                )
-            dk = hashlib.scrypt(
-                password=master_pw,
-                salt=salt,
-                n=KDF_N,
-                r=KDF_R,
-                p=KDF_P,
-                dklen=KDF_DKLEN,
-                maxmem=maxmem,
-            )
+        # Verwende scrypt über _scrypt_raw (hashlib.scrypt mit erhöhtem
+        # maxmem, cryptography nur als Fallback).
+        dk = _scrypt_raw(master_pw, salt, KDF_N, KDF_R, KDF_P, KDF_DKLEN)
     aes_key = dk[0:32]
     chacha_key = dk[32:64]
     mac_key = dk[64:96]
@@ -2082,7 +2535,9 @@ def derive_three_keys(master_pw: bytes, salt: bytes) -> Tuple[bytes, bytes, byte
         del dk
     except Exception:
         pass
-    return aes_key, chacha_key, mac_key
+    keys = (aes_key, chacha_key, mac_key)
+    _kdf_cache_put(cache_key, keys)
+    return keys
 
 # -- Internal KDF helper for decryption with embedded parameters --
 def _derive_three_keys_with_params(master_pw: bytes, salt: bytes, params: Dict[str, object]) -> Tuple[bytes, bytes, bytes]:
@@ -2102,6 +2557,7 @@ def _derive_three_keys_with_params(master_pw: bytes, salt: bytes, params: Dict[s
         ``parallel`` and ``dklen``.  Unknown keys are ignored.
     :returns: a tuple of (aes_key, chacha_key, mac_key)
     """
+    _load_crypto()
     # Bereite das Passwort vor: Keyfile und Geräte-Pepper einmischen.
     try:
         master_pw = _pre_kdf(master_pw)
@@ -2122,8 +2578,14 @@ def _derive_three_keys_with_params(master_pw: bytes, salt: bytes, params: Dict[s
         t = int(params.get("time", 3))
         mem = int(params.get("memory", 262144))
         par = int(params.get("parallel", 4))
+        cache_key = (hashlib.sha512(master_pw).digest(), salt, "argon2",
+                     t, mem, par, dklen)
+        cached = _KDF_RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        # Wie in derive_three_keys: argon2s FFI akzeptiert nur bytes.
         dk = hash_secret_raw(
-            secret=master_pw,
+            secret=bytes(master_pw),
             salt=salt,
             time_cost=t,
             memory_cost=mem,
@@ -2132,32 +2594,17 @@ def _derive_three_keys_with_params(master_pw: bytes, salt: bytes, params: Dict[s
             type=_Argon2Type.ID,
         )
     else:
-        # scrypt fallback
+        # scrypt fallback: _scrypt_raw prefers the OpenSSL-backed
+        # hashlib.scrypt with a raised maxmem
         n = int(params.get("n", KDF_N))
         r = int(params.get("r", KDF_R))
         p = int(params.get("p", KDF_P))
-        # Use cryptography's Scrypt if available to avoid OpenSSL's memory cap
-        if _CryptoScrypt is not None:
-            kdf = _CryptoScrypt(salt=salt, length=dklen, n=n, r=r, p=p)
-            dk = kdf.derive(master_pw)
-        else:
-            # Compute required memory for hashlib.scrypt; double for margin
-            required = 128 * n * r * p
-            MAX_SCRYPT_MAXMEM = 256 * 1024 * 1024  # 256 MiB cap
-            maxmem = min(required * 2, MAX_SCRYPT_MAXMEM)
-            if maxmem < required * 2:
-                raise RuntimeError(
-                    "Scrypt-Fallback nicht sicher (Speicherlimit). Bitte 'cryptography' installieren oder KDF‑Parameter reduzieren."
-                )
-            dk = hashlib.scrypt(
-                password=master_pw,
-                salt=salt,
-                n=n,
-                r=r,
-                p=p,
-                dklen=dklen,
-                maxmem=maxmem,
-            )
+        cache_key = (hashlib.sha512(master_pw).digest(), salt, "scrypt",
+                     n, r, p, dklen)
+        cached = _KDF_RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        dk = _scrypt_raw(master_pw, salt, n, r, p, dklen)
     aes_key = dk[0:32]
     chacha_key = dk[32:64]
     mac_key = dk[64:96]
@@ -2165,29 +2612,127 @@ def _derive_three_keys_with_params(master_pw: bytes, salt: bytes, params: Dict[s
         del dk
     except Exception:
         pass
-    return aes_key, chacha_key, mac_key
+    keys = (aes_key, chacha_key, mac_key)
+    _kdf_cache_put(cache_key, keys)
+    return keys
 
 def hmac_sha512(mac_key: bytes, data: bytes) -> bytes:
     """HMAC-SHA512 über data mit mac_key."""
     return hmac.new(mac_key, data, hashlib.sha512).digest()
 
-def pad_stream_from_mac(mac_key: bytes, nonce_pad: bytes, length: int) -> bytes:
+def hmac_sha512_parts(mac_key: bytes, *parts: bytes) -> bytes:
+    """
+    HMAC-SHA512 über die Verkettung von ``parts`` mit ``mac_key``, ohne die
+    Teile vorher zu einem Gesamtpuffer zusammenzukopieren. Für die großen
+    Ciphertext-Puffer in encrypt/decrypt spart das eine Allokation und
+    einen Kopiervorgang in Dateigröße pro Prüfung.
+    """
+    h = hmac.new(mac_key, digestmod=hashlib.sha512)
+    for part in parts:
+        h.update(part)
+    return h.digest()
+
+def pad_stream_from_mac(mac_key: bytes, nonce_pad: bytes, length: int) -> bytearray:
     """
     Erzeuge deterministischen Pad-Stream aus mac_key und nonce_pad per HMAC-CTR.
     Der Stream hat die Länge 'length'.
+
+    Der HMAC-Zustand über mac_key und nonce_pad wird nur einmal initialisiert
+    und pro 64-Byte-Block kopiert statt neu aufgebaut; die Ausgabe wird vorab
+    alloziert. Die erzeugten Bytes sind identisch zu früheren Versionen
+    (HMAC-SHA512 über nonce_pad||counter), bestehende Tresore bleiben lesbar.
+    Ein schnellerer AES-CTR/ChaCha-Keystream wäre hier zwar möglich, würde
+    aber das Dateiformat brechen.
     """
-    out = bytearray()
+    if length <= 0:
+        return bytearray()
+    base = hmac.new(mac_key, nonce_pad, hashlib.sha512)
+    nblocks = (length + 63) // 64
+    out = bytearray(nblocks * 64)
+    pos = 0
+    for counter in range(nblocks):
+        h = base.copy()
+        h.update(counter.to_bytes(4, "big"))
+        out[pos:pos + 64] = h.digest()
+        pos += 64
+    # Puffer direkt zurückgeben statt zu kopieren; die Aufrufer reichen den
+    # Pad nur an xor_bytes weiter.
+    del out[length:]
+    return out
+
+def xor_pad_from_mac(data: bytes, pad_key: bytes, nonce_pad: bytes) -> bytes:
+    """
+    Verknüpft ``data`` per XOR mit dem HMAC-CTR-Pad aus ``pad_key`` und
+    ``nonce_pad`` (dieselben Bytes wie ``pad_stream_from_mac``).
+
+    Statt erst den kompletten Pad zu materialisieren und dann mit
+    ``xor_bytes`` einen dritten Puffer zu erzeugen, wird der Pad in
+    32-KiB-Stücken erzeugt und direkt in den Ausgabepuffer eingerechnet.
+    Bei großen Tresoren/Stego-Dateien wandert so nur noch ein Puffer in
+    voller Länge durch den Speicher statt drei; das Dateiformat bleibt
+    unverändert.
+    """
+    n = len(data)
+    if n == 0:
+        return b""
+    base = hmac.new(pad_key, nonce_pad, hashlib.sha512)
+    out = bytearray(n)
+    mv = memoryview(data)
+    pos = 0
     counter = 0
-    while len(out) < length:
-        ctr = counter.to_bytes(4, "big")
-        block = hmac.new(mac_key, nonce_pad + ctr, hashlib.sha512).digest()
-        out.extend(block)
-        counter += 1
-    return bytes(out[:length])
+    while pos < n:
+        blocks = min(512, (n - pos + 63) // 64)
+        pad = bytearray(blocks * 64)
+        p = 0
+        for _ in range(blocks):
+            h = base.copy()
+            h.update(counter.to_bytes(4, "big"))
+            pad[p:p + 64] = h.digest()
+            p += 64
+            counter += 1
+        m = min(n - pos, blocks * 64)
+        seg = mv[pos:pos + m]
+        pv = memoryview(pad)[:m] if m != len(pad) else pad
+        out[pos:pos + m] = (
+            int.from_bytes(seg, "little") ^ int.from_bytes(pv, "little")
+        ).to_bytes(m, "little")
+        pos += m
+    return bytes(out)
 
 def xor_bytes(a: bytes, b: bytes) -> bytes:
-    """XOR zweier Byte-Strings gleicher Länge."""
-    return bytes(x ^ y for x, y in zip(a, b))
+    """
+    XOR zweier Byte-Strings gleicher Länge.
+
+    Statt byteweise in Python zu iterieren, werden beide Strings als große
+    Ganzzahlen interpretiert und in einem einzigen C-Schritt verknüpft.
+    Das ist bei Tresor-großen Puffern um Größenordnungen schneller als die
+    frühere Generator-Variante.
+    """
+    n = min(len(a), len(b))
+    # memoryview statt Slice: vermeidet Kopien, wenn a oder b bytearrays
+    # sind (z. B. der Pad-Puffer aus pad_stream_from_mac).
+    va = memoryview(a)[:n] if len(a) != n else a
+    vb = memoryview(b)[:n] if len(b) != n else b
+    return (int.from_bytes(va, "little") ^ int.from_bytes(vb, "little")).to_bytes(n, "little")
+
+# Cache für AEAD-Objekte. AESGCM/ChaCha20Poly1305 führen beim Anlegen eine
+# Key-Expansion durch; bei aufeinanderfolgenden save/load-Vorgängen mit
+# demselben abgeleiteten Schlüssel lohnt sich die Wiederverwendung. Der
+# Cache ist bewusst klein begrenzt, damit abgeleitete Schlüssel nicht
+# unbegrenzt im Speicher verbleiben.
+_AEAD_CACHE: Dict[Tuple[str, bytes], object] = {}
+_AEAD_CACHE_MAX = 8
+
+def _get_aead(cls, key: bytes):
+    """Liefert eine (ggf. gecachte) AEAD-Instanz der Klasse ``cls`` für ``key``."""
+    ck = (cls.__name__, bytes(key))
+    inst = _AEAD_CACHE.get(ck)
+    if inst is None:
+        if len(_AEAD_CACHE) >= _AEAD_CACHE_MAX:
+            _AEAD_CACHE.clear()
+        inst = cls(key)
+        _AEAD_CACHE[ck] = inst
+    return inst
 
 # -----------------------------------------------------------------------------
 # Erweiterte KDF-Vorverarbeitung: Keyfile-Unterstützung und Gerätebindung
@@ -2307,6 +2852,15 @@ def _pre_kdf(master_pw: bytes) -> bytes:
 
 # Passwort-Richtlinie für das Master-Passwort
 MIN_MASTER_LEN = 14
+
+# Vorkompilierte Muster für die Richtlinienprüfung. Die Prüfung läuft u.a.
+# bei jeder Passworteingabe; einmaliges Kompilieren beim Import erspart den
+# wiederholten Weg über den Regex-Cache.
+_POLICY_UPPER_RE = re.compile(r"[A-Z]")
+_POLICY_LOWER_RE = re.compile(r"[a-z]")
+_POLICY_DIGIT_RE = re.compile(r"\d")
+_POLICY_SPECIAL_RE = re.compile(r"[^\w]")
+
 def _check_master_policy(pw: str) -> tuple[bool, str]:
     """
     Überprüft, ob das angegebene Passwort den Mindestanforderungen genügt.
@@ -2316,18 +2870,17 @@ def _check_master_policy(pw: str) -> tuple[bool, str]:
     Sonderzeichen enthält.  Rückgabe ist (True, "OK") bei Erfolg oder
     (False, Grund) bei Nichterfüllung.
     """
-    import re
     if pw is None:
         return False, "Leer"
     if len(pw) < MIN_MASTER_LEN:
         return False, f"Mind. {MIN_MASTER_LEN} Zeichen"
-    if not re.search(r"[A-Z]", pw):
+    if not _POLICY_UPPER_RE.search(pw):
         return False, "Mind. 1 Großbuchstabe"
-    if not re.search(r"[a-z]", pw):
+    if not _POLICY_LOWER_RE.search(pw):
         return False, "Mind. 1 Kleinbuchstabe"
-    if not re.search(r"\d", pw):
+    if not _POLICY_DIGIT_RE.search(pw):
         return False, "Mind. 1 Ziffer"
-    if not re.search(r"[^\w]", pw):
+    if not _POLICY_SPECIAL_RE.search(pw):
         return False, "Mind. 1 Sonderzeichen"
     return True, "OK"
 
@@ -2345,8 +2898,9 @@ def wipe_bytes(b: 'bytearray | bytes') -> None:
             m = ctypes.create_string_buffer(len(b))
             ctypes.memset(ctypes.addressof(m), 0, len(b))
         else:
-            for i in range(len(b)):
-                b[i] = 0
+            # Slice-Zuweisung statt Python-Schleife: ein einzelner
+            # C-Level-memcpy von Nullen, unabhängig von der Länge.
+            b[:] = bytes(len(b))
     except Exception:
         pass
 
@@ -2375,32 +2929,45 @@ def secure_chmod_600(p: 'Path') -> None:
 
 # ---- KDF-Metadaten als TLV (für self-describing Tresore, Version 3) ----
 # KDF_MODE: "argon2" oder "scrypt"
+# Vorkompilierte Struct-Instanzen: spart das wiederholte Parsen der
+# Formatstrings bei jedem pack/unpack-Aufruf im TLV-Pfad.
+_KDF_TLV_STRUCT = struct.Struct(">IIIH")
+_TLV_LEN_STRUCT = struct.Struct(">H")
+# Der fertige TLV wird pro Parametersatz gemerkt. Der Schlüssel enthält alle
+# eingehenden Globals, daher liefert ein durch Kalibrierung oder apply_config
+# geänderter Parametersatz automatisch einen frischen TLV — ein einfacher
+# lru_cache ohne Argumente würde dagegen stale Header ausliefern.
+_KDF_TLV_CACHE: Dict[tuple, bytes] = {}
+
 def _build_kdf_tlv() -> bytes:
     mode = (str(KDF_MODE).lower() if "KDF_MODE" in globals() else "scrypt")
     if mode == "argon2":
         # DATA: time(4)|memKiB(4)|parallel(4)|dklen(2)
-        t  = int(ARGON2_TIME)
-        mem = int(ARGON2_MEMORY)
-        par = int(ARGON2_PARALLELISM)
-        dk  = int(KDF_DKLEN)
-        payload = struct.pack(">IIIH", t, mem, par, dk)
+        params = ("argon2", int(ARGON2_TIME), int(ARGON2_MEMORY),
+                  int(ARGON2_PARALLELISM), int(KDF_DKLEN))
         mode_byte = b"\x02"
     else:
         # scrypt
-        n = int(KDF_N); r = int(KDF_R); p = int(KDF_P); dk = int(KDF_DKLEN)
-        payload = struct.pack(">IIIH", n, r, p, dk)
+        params = ("scrypt", int(KDF_N), int(KDF_R), int(KDF_P), int(KDF_DKLEN))
         mode_byte = b"\x01"
-    return mode_byte + struct.pack(">H", len(payload)) + payload
+    tlv = _KDF_TLV_CACHE.get(params)
+    if tlv is None:
+        payload = _KDF_TLV_STRUCT.pack(*params[1:])
+        tlv = mode_byte + _TLV_LEN_STRUCT.pack(len(payload)) + payload
+        if len(_KDF_TLV_CACHE) >= 8:
+            _KDF_TLV_CACHE.clear()
+        _KDF_TLV_CACHE[params] = tlv
+    return tlv
 
 def _parse_kdf_tlv(blob: bytes, off: int):
     kdf_mode_byte = blob[off]; off += 1
-    (length,) = struct.unpack_from(">H", blob, off); off += 2
+    (length,) = _TLV_LEN_STRUCT.unpack_from(blob, off); off += 2
     payload = blob[off:off+length]; off += length
     if kdf_mode_byte == 1:  # scrypt
-        n, r, p, dk = struct.unpack_from(">IIIH", payload, 0)
+        n, r, p, dk = _KDF_TLV_STRUCT.unpack_from(payload, 0)
         params = {"mode":"scrypt","n":int(n),"r":int(r),"p":int(p),"dklen":int(dk)}
     elif kdf_mode_byte == 2:  # argon2
-        t, mem, par, dk = struct.unpack_from(">IIIH", payload, 0)
+        t, mem, par, dk = _KDF_TLV_STRUCT.unpack_from(payload, 0)
         params = {"mode":"argon2","time":int(t),"memory":int(mem),"parallel":int(par),"dklen":int(dk)}
     else:
         raise ValueError("Unbekannter KDF-Modus im TLV")
@@ -2453,8 +3020,24 @@ def encrypt_vault_bytes(plaintext: bytes, master_pw: bytes) -> bytes:
     EXTRA_ENCRYPTION_LAYERS``.  Beim Entschlüsseln liest die Funktion diese Versionsnummer
     aus und entfernt die Schichten entsprechend.
     """
-    # Generiere das primäre Salt für die inneren Schlüssel
-    salt = secrets.token_bytes(SALT_LEN)
+    _load_crypto()
+    # Einmalige Anpassung der KDF-Kosten, bevor die Parameter in den
+    # KDF-TLV geschrieben werden: Argon2-Speicher an den verfügbaren RAM
+    # klemmen bzw. scrypt-Kosten kalibrieren. Beides läuft vor
+    # _build_kdf_tlv, damit Header und tatsächliche Ableitung dieselben
+    # Parameter verwenden.
+    if KDF_MODE == "argon2" and _HAS_ARGON2:
+        resolve_argon2_parallelism()
+        clamp_argon2_memory()
+    else:
+        calibrate_kdf_params()
+    # Ziehe Salt und alle drei Nonces mit einem einzigen urandom-Aufruf und
+    # zerlege den Puffer anschließend, statt vier einzelne Syscalls abzusetzen.
+    rnd = secrets.token_bytes(SALT_LEN + 3 * NONCE_LEN)
+    salt = rnd[:SALT_LEN]
+    nonce_aes = rnd[SALT_LEN:SALT_LEN + NONCE_LEN]
+    nonce_pad = rnd[SALT_LEN + NONCE_LEN:SALT_LEN + 2 * NONCE_LEN]
+    nonce_chacha = rnd[SALT_LEN + 2 * NONCE_LEN:]
     # Erzeuge den KDF‑TLV, der die aktuellen KDF‑Parameter enthält
     kdf_tlv = _build_kdf_tlv()
     # Bestimme die Anzahl zusätzlicher Schichten.  Verwende den konfigurierbaren Wert
@@ -2486,23 +3069,26 @@ def encrypt_vault_bytes(plaintext: bytes, master_pw: bytes) -> bytes:
 
     # === Triple‑Verschlüsselung (Version 3) ===
     # AES‑GCM: verschlüsselt den Klartext mit einem zufälligen Nonce und inner_header als AAD
-    nonce_aes = secrets.token_bytes(NONCE_LEN)
-    aesgcm = AESGCM(aes_key)
+    aesgcm = _get_aead(AESGCM, aes_key)
     ciphertext_aes = aesgcm.encrypt(nonce_aes, plaintext, inner_header)
     # XOR‑Pad: generiere Pad aus pad_key und neuem Nonce
-    nonce_pad = secrets.token_bytes(NONCE_LEN)
-    pad = pad_stream_from_mac(pad_key, nonce_pad, len(ciphertext_aes))
-    obf = xor_bytes(ciphertext_aes, pad)
+    obf = xor_pad_from_mac(ciphertext_aes, pad_key, nonce_pad)
     # ChaCha20‑Poly1305: verschlüsselt obf mit neuem Nonce, inner_header als AAD
-    nonce_chacha = secrets.token_bytes(NONCE_LEN)
-    chacha = ChaCha20Poly1305(chacha_key)
+    chacha = _get_aead(ChaCha20Poly1305, chacha_key)
     ciphertext_chacha = chacha.encrypt(nonce_chacha, obf, inner_header)
-    # Körper des Triple‑Blobs: Salt + Nonces + Ciphertext
-    triple_body = salt + nonce_aes + nonce_pad + nonce_chacha + ciphertext_chacha
-    # HMAC über inner_header||triple_body
-    triple_hmac = hmac_sha512(hmac_key, inner_header + triple_body)
-    # Vollständiger v3‑Blob
-    triple_blob = inner_header + triple_body + triple_hmac
+    # v3-Blob in einem vorallozierten Puffer zusammensetzen statt über
+    # Konkatenationsketten, die mehrere Zwischenkopien in Dateigröße anlegen.
+    body_len = (len(inner_header) + len(salt) + len(nonce_aes)
+                + len(nonce_pad) + len(nonce_chacha) + len(ciphertext_chacha))
+    triple_blob = bytearray(body_len + 64)
+    pos = 0
+    for part in (inner_header, salt, nonce_aes, nonce_pad, nonce_chacha, ciphertext_chacha):
+        triple_blob[pos:pos + len(part)] = part
+        pos += len(part)
+    # HMAC über inner_header||Körper, direkt aus dem Puffer gelesen
+    triple_hmac = hmac_sha512_parts(hmac_key, memoryview(triple_blob)[:pos])
+    triple_blob[pos:] = triple_hmac
+    triple_blob = bytes(triple_blob)
 
     # === Optionale äußere Schichten ===
     if layers > 0:
@@ -2523,33 +3109,36 @@ def encrypt_vault_bytes(plaintext: bytes, master_pw: bytes) -> bytes:
             # wie bisher.
             _mm = master_pw
         for i in range(layers):
-            salt_extra = secrets.token_bytes(SALT_LEN)
-            nonce_extra = secrets.token_bytes(NONCE_LEN)
+            # Salt und Nonce der Schicht in einem Zug ziehen
+            rnd_i = secrets.token_bytes(SALT_LEN + NONCE_LEN)
+            salt_extra = rnd_i[:SALT_LEN]
+            nonce_extra = rnd_i[SALT_LEN:]
             # Layer-spezifische Schlüssel ableiten
             pad_key_i = hmac_sha512(_mm, salt_extra + f"layer{i}_pad".encode())
             hmac_key_i = hmac_sha512(_mm, salt_extra + f"layer{i}_hmac".encode())
-            pad_i = pad_stream_from_mac(pad_key_i, nonce_extra, len(blob))
-            cipher_i = xor_bytes(blob, pad_i)
-            hmac_i = hmac_sha512(hmac_key_i, final_header + salt_extra + nonce_extra + cipher_i)
+            cipher_i = xor_pad_from_mac(blob, pad_key_i, nonce_extra)
+            hmac_i = hmac_sha512_parts(hmac_key_i, final_header, salt_extra, nonce_extra, cipher_i)
             salts.append(salt_extra)
             nonces.append(nonce_extra)
             hmacs.append(hmac_i)
             blob = cipher_i
             # Sensitive data cleanup per layer
             try:
-                del pad_key_i, hmac_key_i, pad_i
+                del pad_key_i, hmac_key_i
             except Exception:
                 pass
-        # Final zusammenbauen: Header, alle Salt/Nonce-Paare, Cipher und HMACs
-        final_cipher = blob
-        out = final_header
+        # Final zusammenbauen: Header, alle Salt/Nonce-Paare, Cipher und HMACs.
+        # b"".join berechnet die Gesamtgröße vorab und kopiert jeden Teil
+        # genau einmal, statt den Puffer pro += neu anzulegen.
+        parts = [final_header]
         for s, n in zip(salts, nonces):
-            out += s + n
-        out += final_cipher
-        for hm in hmacs:
-            out += hm
+            parts.append(s)
+            parts.append(n)
+        parts.append(blob)
+        parts.extend(hmacs)
+        out = b"".join(parts)
         try:
-            del salts, nonces, hmacs, final_cipher, blob
+            del salts, nonces, hmacs, parts, blob
         except Exception:
             pass
     else:
@@ -2558,7 +3147,7 @@ def encrypt_vault_bytes(plaintext: bytes, master_pw: bytes) -> bytes:
 
     # Bereinige Schlüssel und temporäre Daten
     try:
-        del aes_key, chacha_key, pad_key, hmac_key, pad, obf, ciphertext_aes, ciphertext_chacha, triple_body, triple_hmac, triple_blob
+        del aes_key, chacha_key, pad_key, hmac_key, obf, ciphertext_aes, ciphertext_chacha, triple_hmac, triple_blob
     except Exception:
         pass
     return out
@@ -2589,6 +3178,7 @@ def decrypt_vault_bytes(blob: bytes, master_pw: bytes) -> bytes:
       Kompatibilität mit älteren Version‑4‑Dateien wird beim Entschlüsseln mit einer einzelnen
       Schicht zusätzlich eine alternative Ableitung (``extra_pad``/``extra_hmac``) versucht.
     """
+    _load_crypto()
     # Mindestlänge sicherstellen: MAGIC (4) + VER (1) + (mindestens 3 Nonces, Salt und HMAC)
     # Die genaue Größe wird je nach Version weiter unten geprüft.
     if len(blob) < 4 + 1 + SALT_LEN + NONCE_LEN * 3 + 64:
@@ -2622,7 +3212,8 @@ def decrypt_vault_bytes(blob: bytes, master_pw: bytes) -> bytes:
         if len(blob) < off + hmac_area_len:
             raise ValueError("Datei beschädigt – HMAC‑Bereich fehlt")
         cipher_end = len(blob) - hmac_area_len
-        final_cipher = blob[off:cipher_end]
+        # Wie im v3-Zweig: der große Cipher-Bereich bleibt eine memoryview.
+        final_cipher = memoryview(blob)[off:cipher_end]
         # Extrahiere die HMACs in derselben Reihenfolge wie beim Verschlüsseln
         hmacs: list[bytes] = []
         for i in range(layers):
@@ -2654,16 +3245,15 @@ def decrypt_vault_bytes(blob: bytes, master_pw: bytes) -> bytes:
                 pad_key_i = hmac_sha512(_mm, salt_i + f"layer{i}_pad".encode())
                 hmac_key_i = hmac_sha512(_mm, salt_i + f"layer{i}_hmac".encode())
                 # Berechne die erwartete HMAC und vergleiche mit dem gespeicherten Wert
-                expected_hmac = hmac_sha512(hmac_key_i, header + salt_i + nonce_i + current_blob)
+                expected_hmac = hmac_sha512_parts(hmac_key_i, header, salt_i, nonce_i, current_blob)
                 if not hmac.compare_digest(expected_hmac, hmac_i):
                     raise ValueError("HMAC-Überprüfung fehlgeschlagen")
                 # Entferne das XOR‑Pad
-                pad_i = pad_stream_from_mac(pad_key_i, nonce_i, len(current_blob))
                 # Entschlüsselte Nutzdaten für die nächste Schicht (oder innere v3‑Blob)
-                current_blob = xor_bytes(current_blob, pad_i)
+                current_blob = xor_pad_from_mac(current_blob, pad_key_i, nonce_i)
                 # Aufräumen
                 try:
-                    del pad_key_i, hmac_key_i, pad_i, expected_hmac
+                    del pad_key_i, hmac_key_i, expected_hmac
                 except Exception:
                     pass
         except ValueError:
@@ -2689,14 +3279,13 @@ def decrypt_vault_bytes(blob: bytes, master_pw: bytes) -> bytes:
                 extra_hmac_key = hmac_sha512(
                     _mm_fallback, salt_i + b"extra_hmac"
                 )
-                expected2 = hmac_sha512(extra_hmac_key, header + salt_i + nonce_i + current_blob)
+                expected2 = hmac_sha512_parts(extra_hmac_key, header, salt_i, nonce_i, current_blob)
                 if not hmac.compare_digest(expected2, hmac_i):
                     raise ValueError("HMAC-Überprüfung fehlgeschlagen – falsches Passwort oder manipulierte Datei")
-                pad_extra = pad_stream_from_mac(extra_pad_key, nonce_i, len(current_blob))
-                current_blob = xor_bytes(current_blob, pad_extra)
+                current_blob = xor_pad_from_mac(current_blob, extra_pad_key, nonce_i)
                 fallback_used = True
                 try:
-                    del extra_pad_key, extra_hmac_key, pad_extra, expected2
+                    del extra_pad_key, extra_hmac_key, expected2
                 except Exception:
                     pass
             else:
@@ -2727,7 +3316,10 @@ def decrypt_vault_bytes(blob: bytes, master_pw: bytes) -> bytes:
         nonce_chacha = blob[off:off+NONCE_LEN]; off += NONCE_LEN
         if len(blob) < off + 64:
             raise ValueError("HMAC fehlt/Datei beschädigt")
-        ciphertext_chacha = blob[off:-64]
+        # memoryview statt Slice: bei großen (ggf. mmap-basierten) Blobs wird
+        # der Ciphertext nicht erst in ein neues Bytes-Objekt kopiert; die
+        # AEAD-Implementierung akzeptiert beliebige Puffer.
+        ciphertext_chacha = memoryview(blob)[off:-64]
         file_hmac = blob[-64:]
 
         # Derive keys using the parameters stored within the file.  We intentionally ignore
@@ -2738,20 +3330,22 @@ def decrypt_vault_bytes(blob: bytes, master_pw: bytes) -> bytes:
         try: del mac_key
         except Exception: pass
 
-        calc = hmac_sha512(hmac_key, header + (salt + nonce_aes + nonce_pad + nonce_chacha + ciphertext_chacha))
+        # Header und Körper liegen im Original-Blob bereits zusammenhängend vor;
+        # der HMAC wird direkt über eine memoryview berechnet, statt die
+        # Teilstücke erneut zu konkatenieren.
+        calc = hmac_sha512(hmac_key, memoryview(blob)[:-64])
         if not hmac.compare_digest(calc, file_hmac):
             raise ValueError("HMAC-Überprüfung fehlgeschlagen — falsches Passwort oder manipulierte Datei")
 
-        chacha = ChaCha20Poly1305(chacha_key)
+        chacha = _get_aead(ChaCha20Poly1305, chacha_key)
         obf = chacha.decrypt(nonce_chacha, ciphertext_chacha, header)
 
-        pad = pad_stream_from_mac(pad_key, nonce_pad, len(obf))
-        ciphertext_aes = xor_bytes(obf, pad)
+        ciphertext_aes = xor_pad_from_mac(obf, pad_key, nonce_pad)
 
-        aesgcm = AESGCM(aes_key)
+        aesgcm = _get_aead(AESGCM, aes_key)
         plaintext = aesgcm.decrypt(nonce_aes, ciphertext_aes, header)
         # Cleanup
-        try: del aes_key, chacha_key, pad_key, hmac_key, pad, obf, ciphertext_aes
+        try: del aes_key, chacha_key, pad_key, hmac_key, obf, ciphertext_aes
         except Exception: pass
         return plaintext
 
@@ -2769,18 +3363,18 @@ def decrypt_vault_bytes(blob: bytes, master_pw: bytes) -> bytes:
         try: del mac_key
         except Exception: pass
 
-        body = salt + nonce_aes + nonce_pad + nonce_chacha + ciphertext_chacha
-        calc = hmac_sha512(hmac_key, body)
+        # Der Körper (Salt + Nonces + Ciphertext) ist im Blob zusammenhängend;
+        # HMAC direkt über eine memoryview statt über neue Konkatenation.
+        calc = hmac_sha512(hmac_key, memoryview(blob)[5:-64])
         if not hmac.compare_digest(calc, file_hmac):
             raise ValueError("HMAC-Überprüfung fehlgeschlagen — falsches Passwort oder manipulierte Datei")
 
-        chacha = ChaCha20Poly1305(chacha_key)
+        chacha = _get_aead(ChaCha20Poly1305, chacha_key)
         obf = chacha.decrypt(nonce_chacha, ciphertext_chacha, None)
-        pad = pad_stream_from_mac(pad_key, nonce_pad, len(obf))
-        ciphertext_aes = xor_bytes(obf, pad)
-        aesgcm = AESGCM(aes_key)
+        ciphertext_aes = xor_pad_from_mac(obf, pad_key, nonce_pad)
+        aesgcm = _get_aead(AESGCM, aes_key)
         plaintext = aesgcm.decrypt(nonce_aes, ciphertext_aes, None)
-        try: del aes_key, chacha_key, pad_key, hmac_key, pad, obf, ciphertext_aes
+        try: del aes_key, chacha_key, pad_key, hmac_key, obf, ciphertext_aes
         except Exception: pass
         return plaintext
 
@@ -2799,39 +3393,60 @@ def decrypt_hidden_payload(stego_path: Path, master_pw_str: str) -> Tuple[str, b
     Nutzdaten gespeichert. Falls keine solche Struktur vorliegt (ältere
     versteckte Dateien), wird ein generischer Name zurückgegeben.
     """
-    # Lese komplette Datei ein
-    full = Path(stego_path).read_bytes()
-    # Datei muss mindestens Marker + Längenfeld enthalten
-    if len(full) < len(STEGO_MARKER) + STEGO_LENGTH_LEN:
-        raise ValueError("Datei enthält keine versteckten Daten (zu kurz)")
-    # Prüfe Marker am Dateiende
-    if full[-len(STEGO_MARKER):] != STEGO_MARKER:
-        raise ValueError("Kein versteckter Inhalt gefunden (Marker fehlt)")
-    # Lese die Länge des verschlüsselten Segments, die vor dem Marker gespeichert ist
-    # Position des Längenfelds: direkt vor dem Marker
-    len_field_start = len(full) - len(STEGO_MARKER) - STEGO_LENGTH_LEN
-    enc_len = int.from_bytes(full[len_field_start:len_field_start + STEGO_LENGTH_LEN], "big")
-    # Validitätsprüfung: Die verschlüsselte Länge muss positiv sein und innerhalb des
-    # durch das Dateiende und den Marker definierten Bereichs liegen. Ist die Länge
-    # größer als der Bereich, in dem die Nutzlast liegen kann, ist die Datei
-    # beschädigt oder nicht korrekt formatiert.
-    max_payload_len = len(full) - len(STEGO_MARKER) - STEGO_LENGTH_LEN
-    if enc_len <= 0 or enc_len > max_payload_len:
-        raise ValueError("Ungültige Länge des versteckten Inhalts")
-    # Start- und Endposition des verschlüsselten Segments bestimmen.
-    # Das verschlüsselte Segment endet direkt vor dem Längenfeld.
-    enc_end = len(full) - len(STEGO_MARKER) - STEGO_LENGTH_LEN
-    enc_start = enc_end - enc_len
-    if enc_start < 0 or enc_start > enc_end:
-        raise ValueError("Versteckter Inhalt beschädigt")
-    enc = full[enc_start:enc_end]
+    # Die Datei wird per mmap eingeblendet statt komplett gelesen: für die
+    # Marker-/Längenprüfung werden nur die letzten Bytes angefasst und
+    # anschließend ausschließlich das verschlüsselte Segment kopiert. Bei
+    # großen Cover-Dateien lädt das Betriebssystem so nur die tatsächlich
+    # benötigten Seiten. Schlägt mmap fehl (z. B. exotische Dateisysteme),
+    # wird wie früher die ganze Datei gelesen.
+    full: Union[bytes, mmap.mmap]
+    mm = None
+    try:
+        with open(stego_path, "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        full = mm
+    except (ValueError, OSError):
+        full = Path(stego_path).read_bytes()
+    try:
+        # Datei muss mindestens Marker + Längenfeld enthalten
+        if len(full) < len(STEGO_MARKER) + STEGO_LENGTH_LEN:
+            raise ValueError("Datei enthält keine versteckten Daten (zu kurz)")
+        # Prüfe Marker am Dateiende
+        if full[-len(STEGO_MARKER):] != STEGO_MARKER:
+            raise ValueError("Kein versteckter Inhalt gefunden (Marker fehlt)")
+        # Lese die Länge des verschlüsselten Segments, die vor dem Marker gespeichert ist
+        # Position des Längenfelds: direkt vor dem Marker
+        len_field_start = len(full) - len(STEGO_MARKER) - STEGO_LENGTH_LEN
+        # unpack_from liest direkt aus dem Puffer/mmap, ohne erst einen
+        # Bytes-Slice für int.from_bytes anzulegen.
+        enc_len = struct.unpack_from(">Q", full, len_field_start)[0]
+        # Validitätsprüfung: Die verschlüsselte Länge muss positiv sein und innerhalb des
+        # durch das Dateiende und den Marker definierten Bereichs liegen. Ist die Länge
+        # größer als der Bereich, in dem die Nutzlast liegen kann, ist die Datei
+        # beschädigt oder nicht korrekt formatiert.
+        max_payload_len = len(full) - len(STEGO_MARKER) - STEGO_LENGTH_LEN
+        if enc_len <= 0 or enc_len > max_payload_len:
+            raise ValueError("Ungültige Länge des versteckten Inhalts")
+        # Start- und Endposition des verschlüsselten Segments bestimmen.
+        # Das verschlüsselte Segment endet direkt vor dem Längenfeld.
+        enc_end = len(full) - len(STEGO_MARKER) - STEGO_LENGTH_LEN
+        enc_start = enc_end - enc_len
+        if enc_start < 0 or enc_start > enc_end:
+            raise ValueError("Versteckter Inhalt beschädigt")
+        enc = bytes(full[enc_start:enc_end])
+    finally:
+        if mm is not None:
+            try:
+                mm.close()
+            except Exception:
+                pass
+        del full
     master_pw = bytearray(master_pw_str.encode("utf-8"))
     try:
-        decrypted = decrypt_vault_bytes(enc, bytes(master_pw))
+        decrypted = decrypt_vault_bytes(enc, master_pw)
     finally:
         # zeroize password
-        for i in range(len(master_pw)):
-            master_pw[i] = 0
+        wipe_bytes(master_pw)
         del master_pw
     # Versuche, Header mit ursprünglichem Dateinamen zu parsen.
     orig_name = "extracted.bin"
@@ -2863,11 +3478,10 @@ def encrypt_file_data(in_path: Path, master_pw_str: str, out_path: Path) -> None
     data = Path(in_path).read_bytes()
     master_pw = bytearray(master_pw_str.encode("utf-8"))
     try:
-        blob = encrypt_vault_bytes(data, bytes(master_pw))
+        blob = encrypt_vault_bytes(data, master_pw)
     finally:
         # lösche Passwort aus Speicher
-        for i in range(len(master_pw)):
-            master_pw[i] = 0
+        wipe_bytes(master_pw)
         del master_pw
     atomic_write(Path(out_path), blob)
 
@@ -2882,10 +3496,9 @@ def decrypt_file_data(in_path: Path, master_pw_str: str, out_path: Path) -> None
     blob = Path(in_path).read_bytes()
     master_pw = bytearray(master_pw_str.encode("utf-8"))
     try:
-        data = decrypt_vault_bytes(blob, bytes(master_pw))
+        data = decrypt_vault_bytes(blob, master_pw)
     finally:
-        for i in range(len(master_pw)):
-            master_pw[i] = 0
+        wipe_bytes(master_pw)
         del master_pw
     atomic_write(Path(out_path), data)
 
@@ -2902,10 +3515,10 @@ def hide_file_in_file(cover_path: Path, data_path: Path, master_pw_str: str, out
     Verstecken **zweimal** eingeben (siehe Aufrufe in GUI/CLI), um Eingabefehler
     auszuschließen.
     """
-    cover_bytes = Path(cover_path).read_bytes()
-    # Mindestgröße für Cover-Datei, um triviale Erkennung zu erschweren
+    # Nur die Größe prüfen; der Inhalt wird beim Schreiben stückweise
+    # durchgereicht statt komplett in den Speicher geladen.
     MIN_COVER_BYTES = 1 * 1024 * 1024
-    if len(cover_bytes) < MIN_COVER_BYTES:
+    if os.path.getsize(cover_path) < MIN_COVER_BYTES:
         raise ValueError("Cover-Datei zu klein (min. 1 MiB empfohlen).")
     data_bytes = Path(data_path).read_bytes()
     # Füge den ursprünglichen Dateinamen (mit Erweiterung) in die Nutzdaten ein.
@@ -2917,15 +3530,27 @@ def hide_file_in_file(cover_path: Path, data_path: Path, master_pw_str: str, out
     # Verschlüsseln des Headers + Nutzdaten
     master_pw = bytearray(master_pw_str.encode("utf-8"))
     try:
-        enc = encrypt_vault_bytes(header, bytes(master_pw))
+        enc = encrypt_vault_bytes(header, master_pw)
     finally:
-        for i in range(len(master_pw)):
-            master_pw[i] = 0
+        wipe_bytes(master_pw)
         del master_pw
     length_bytes = len(enc).to_bytes(STEGO_LENGTH_LEN, "big")
-    # Neues File: cover + verschlüsselter Inhalt + Länge + Marker
-    new_bytes = cover_bytes + enc + length_bytes + STEGO_MARKER
-    atomic_write(Path(out_path), new_bytes)
+
+    # Neues File: cover + verschlüsselter Inhalt + Länge + Marker. Die
+    # Cover-Datei wird in 1-MiB-Blöcken gestreamt; der Spitzenverbrauch
+    # hängt damit nur noch an der Nutzlast, nicht an der Cover-Größe.
+    def _stego_chunks() -> Iterable[bytes]:
+        with open(cover_path, "rb") as src:
+            while True:
+                chunk = src.read(1 << 20)
+                if not chunk:
+                    break
+                yield chunk
+        yield enc
+        yield length_bytes
+        yield STEGO_MARKER
+
+    atomic_write(Path(out_path), _stego_chunks())
 
 def extract_hidden_file_to_path(stego_path: Path, master_pw_str: str, out_path: Path) -> None:
     """Extrahiert eine zuvor versteckte Datei aus ``stego_path`` und schreibt sie nach ``out_path``.
@@ -2948,7 +3573,7 @@ def extract_hidden_file_to_path(stego_path: Path, master_pw_str: str, out_path:
 # ====================================
 # SECTION F — Dateispeicher / Backup / Atomic Write
 # ====================================
-def atomic_write(path: Path, data: bytes) -> None:
+def atomic_write(path: Path, data: Union[bytes, Iterable[bytes]]) -> None:
     """
     Führe einen atomaren Schreibvorgang aus. Es wird eine zufällige temporäre
     Datei im selben Verzeichnis erstellt, die Daten werden geschrieben und
@@ -2956,15 +3581,30 @@ def atomic_write(path: Path, data: bytes) -> None:
     verschoben. Dadurch werden „Time-of-check/Time-of-use“-Angriffe vermieden.
     Auf POSIX-Systemen wird die temporäre Datei mit restriktiven
     Zugriffsrechten (0600) angelegt.
+
+    ``data`` darf statt eines Bytes-Objekts auch ein Iterable von
+    Bytes-Stücken sein; damit können Aufrufer wie ``hide_file_in_file``
+    große Dateien stückweise schreiben, ohne sie komplett im Speicher
+    zusammenzusetzen.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     # Erzeuge sichere temporäre Datei im Zielverzeichnis
     fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "wb") as f:
-            f.write(data)
-            f.flush()
-            os.fsync(f.fileno())
+        # Direkt über os.write auf den Deskriptor schreiben statt über einen
+        # gepufferten Python-File-Wrapper: spart eine Kopie der kompletten
+        # Daten und einen Flush-Schritt. Partielle Writes werden per
+        # memoryview-Schleife behandelt.
+        try:
+            chunks = (data,) if isinstance(data, (bytes, bytearray, memoryview)) else data
+            for chunk in chunks:
+                mv = memoryview(chunk)
+                while mv:
+                    written = os.write(fd, mv)
+                    mv = mv[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         # set restrictive perms on POSIX
         try:
             if os.name == "posix":
@@ -2992,15 +3632,50 @@ def rotate_backups(path: Path, keep: int = BACKUP_KEEP) -> None:
     Backup-Name: path.name + .bak.YYYYMMDDhhmmss
     """
     bakdir = path.parent
-    base = path.name
-    # remove old backups beyond keep
-    files = sorted([p for p in bakdir.iterdir() if p.name.startswith(base + ".bak.")], key=lambda p: p.stat().st_mtime, reverse=True)
-    for old in files[keep:]:
+    prefix = path.name + ".bak."
+    # os.scandir liefert DirEntry-Objekte, deren stat()-Daten aus dem
+    # Verzeichnis-Scan stammen — ein Systemaufruf für das Verzeichnis statt
+    # eines stat() pro Backup-Datei.
+    try:
+        with os.scandir(bakdir) as it:
+            files = [
+                (entry.stat(follow_symlinks=False).st_mtime, entry.path)
+                for entry in it
+                if entry.name.startswith(prefix)
+            ]
+    except OSError:
+        return
+    files.sort(reverse=True)
+    for _mtime, old in files[keep:]:
         try:
-            old.unlink()
+            os.unlink(old)
         except Exception:
             pass
 
+def _copy_file_fast(src: Path, dst: Path) -> None:
+    """
+    Kopiert src nach dst. Auf Linux wird os.sendfile genutzt (Kopie im
+    Kernel, keine Userspace-Puffer), sonst shutil.copyfileobj mit großem
+    Puffer statt der 8-KiB-Blöcke von shutil.copy.
+    """
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            size = os.fstat(s.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            if offset >= size:
+                return
+            s.seek(offset)
+        except (AttributeError, OSError):
+            s.seek(0)
+            d.seek(0)
+            d.truncate()
+        shutil.copyfileobj(s, d, 1 << 20)
+
 def backup_before_overwrite(path: Path) -> None:
     """
     Wenn path existiert, lege Backup mit Zeitstempel an.
@@ -3010,7 +3685,8 @@ def backup_before_overwrite(path: Path) -> None:
     t = time.strftime("%Y%m%d%H%M%S", time.localtime())
     bak = path.with_name(path.name + f".bak.{t}")
     try:
-        shutil.copy2(path, bak)
+        _copy_file_fast(path, bak)
+        shutil.copystat(path, bak)
     except Exception:
         try:
             shutil.copy(path, bak)
@@ -3052,13 +3728,20 @@ def save_vault(path: Path, vault: Vault, master_pw_str: str, make_backup: bool =
             "updated_at": time.time(),
             "flags": flags,
         },
-        "entries": {eid: asdict(e) for eid, e in vault.entries.items()}
+        # Flache Feld-Serialisierung statt asdict(): asdict() kopiert
+        # rekursiv alle Felder (teuer bei vielen Einträgen/Anhängen), während
+        # die Entry-Felder ohnehin nur JSON-kompatible Werte enthalten und
+        # hier lediglich gelesen werden.
+        "entries": {
+            eid: {name: getattr(e, name) for name in _ENTRY_FIELD_NAMES}
+            for eid, e in vault.entries.items()
+        }
     }
-    plaintext = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    plaintext = _json_dumps_bytes(obj)
     # Optionales Dateigrößen-Padding: Wenn ``MIN_VAULT_SIZE_KB`` größer als 0 ist,
     # wird später geprüft, ob die verschlüsselte Datei eine Mindestgröße unterschreitet.
-    # In diesem Fall fügen wir zufällige Daten als base64-codiertes Feld
-    # ``pad`` in den Metadaten hinzu und verschlüsseln erneut.
+    # In diesem Fall werden rohe Zufallsbytes hinter dem JSON-Dokument angehängt
+    # (abgetrennt durch ein NUL-Byte) und genau einmal neu verschlüsselt.
     min_size = globals().get("MIN_VAULT_SIZE_KB", 0)
     try:
         desired_bytes = int(min_size) * 1024
@@ -3068,7 +3751,7 @@ def save_vault(path: Path, vault: Vault, master_pw_str: str, make_backup: bool =
     # master_pw als bytearray zum späteren Löschen
     master_pw = bytearray(master_pw_str.encode("utf-8"))
     try:
-        blob = encrypt_vault_bytes(plaintext, bytes(master_pw))
+        blob = encrypt_vault_bytes(plaintext, master_pw)
         # Padding falls erforderlich hinzufügen. Wir prüfen die resultierende
         # Blob-Größe erst nach der ersten Verschlüsselung, um den tatsächlichen
         # Overhead (Nonces, HMAC) zu berücksichtigen. Wenn die Datei zu klein
@@ -3076,33 +3759,28 @@ def save_vault(path: Path, vault: Vault, master_pw_str: str, make_backup: bool =
         # ``pad`` hinzu. Anschließend wird erneut verschlüsselt. Bei Bedarf
         # versuchen wir es ein zweites Mal, falls das Ergebnis noch zu klein ist.
         if desired_bytes > 0 and len(blob) < desired_bytes:
-            import os
-            import base64
+            # Der Verschlüsselungs-Overhead (Header, Nonces, Tags, HMACs) ist
+            # unabhängig von der Klartextlänge konstant: jedes zusätzliche
+            # Klartextbyte vergrößert den Blob um genau ein Byte. Die nötige
+            # Padding-Länge lässt sich daher exakt aus der ersten Messung
+            # bestimmen — es bleibt bei genau einer weiteren Verschlüsselung
+            # statt bis zu zwei blinder Nachbesserungen. (Den Overhead vorab
+            # zu berechnen würde KDF-TLV-Länge und Schichtanzahl duplizieren
+            # und bei Formatänderungen stillschweigend falsch werden.)
+            #
+            # Das Padding wird als rohe Zufallsbytes hinter dem JSON-Dokument
+            # angehängt, getrennt durch ein NUL-Byte, das in JSON-Ausgaben
+            # nie vorkommt (dort stets als \u0000 maskiert). Das erspart die
+            # Base64-Expansion und die erneute Serialisierung; load_vault
+            # schneidet den Schwanz am NUL-Byte wieder ab. Die Zufallsbytes
+            # sind nach der AEAD-Kaskade ohnehin nicht von Ciphertext zu
+            # unterscheiden.
             missing = desired_bytes - len(blob)
-            if missing < 0:
-                missing = 0
-            # Generiere Zufallsbytes. Die Länge entspricht der fehlenden Größe.
-            pad_bytes = os.urandom(missing)
-            pad_b64 = base64.b64encode(pad_bytes).decode("ascii")
-            # Füge Padding in die Metadaten ein
-            obj["meta"]["pad"] = pad_b64
-            # Serialisiere neu und verschlüssele erneut
-            plaintext2 = json.dumps(obj, ensure_ascii=False).encode("utf-8")
-            blob = encrypt_vault_bytes(plaintext2, bytes(master_pw))
-            # Prüfe erneut, ob das Ziel erreicht wurde; falls nicht, versuche ein zweites Mal
-            if len(blob) < desired_bytes:
-                extra = desired_bytes - len(blob)
-                if extra < 0:
-                    extra = 0
-                pad2 = os.urandom(extra)
-                pad_b64_2 = base64.b64encode(pad2).decode("ascii")
-                obj["meta"]["pad"] = obj["meta"].get("pad", "") + "." + pad_b64_2
-                plaintext3 = json.dumps(obj, ensure_ascii=False).encode("utf-8")
-                blob = encrypt_vault_bytes(plaintext3, bytes(master_pw))
+            plaintext2 = b"".join((plaintext, b"\x00", os.urandom(missing - 1))) if missing > 1 else plaintext + b"\x00"
+            blob = encrypt_vault_bytes(plaintext2, master_pw)
     finally:
         # wipe master password from memory (best-effort)
-        for i in range(len(master_pw)):
-            master_pw[i] = 0
+        wipe_bytes(master_pw)
         del master_pw
 
     # Backup vor dem Überschreiben nur erstellen, wenn globale Backups erlaubt sind
@@ -3118,20 +3796,51 @@ def save_vault(path: Path, vault: Vault, master_pw_str: str, make_backup: bool =
     except Exception:
         pass
 
+# Ab dieser Dateigröße wird der Tresor per mmap eingeblendet statt komplett
+# per read() in den Speicher kopiert. decrypt_vault_bytes arbeitet ohnehin nur
+# mit Offsets und Slices, sodass die Seiten bedarfsgesteuert geladen werden.
+_MMAP_LOAD_THRESHOLD = 1 * 1024 * 1024
+
 def load_vault(path: Path, master_pw_str: str) -> Vault:
     """
     Läd die Datei, entschlüsselt mit master_pw und baut Vault Objekt auf.
+    Große Dateien (ab ``_MMAP_LOAD_THRESHOLD``) werden per Memory-Mapping
+    gelesen, kleine weiterhin mit einem einzelnen ``read()``.
     """
-    with open(path, "rb") as f:
-        blob = f.read()
     master_pw = bytearray(master_pw_str.encode("utf-8"))
     try:
-        plaintext = decrypt_vault_bytes(blob, bytes(master_pw))
+        with open(path, "rb") as f:
+            try:
+                size = os.fstat(f.fileno()).st_size
+            except Exception:
+                size = 0
+            if size >= _MMAP_LOAD_THRESHOLD:
+                # Kein Context-Manager: wenn decrypt_vault_bytes eine
+                # Exception wirft (z. B. falsches Passwort), halten die
+                # Frame-Lokalen im Traceback noch memoryviews auf das
+                # Mapping; mm.close() würde dann mit einem BufferError die
+                # eigentliche Fehlermeldung ersetzen. Stattdessen wie in
+                # decrypt_hidden_payload best-effort schließen.
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    plaintext = decrypt_vault_bytes(mm, master_pw)
+                finally:
+                    try:
+                        mm.close()
+                    except Exception:
+                        pass
+            else:
+                plaintext = decrypt_vault_bytes(f.read(), master_pw)
     finally:
-        for i in range(len(master_pw)):
-            master_pw[i] = 0
+        wipe_bytes(master_pw)
         del master_pw
-    obj = json.loads(plaintext.decode("utf-8"))
+    # Größen-Padding abtrennen: neuere Tresore hängen hinter dem JSON ein
+    # NUL-Byte und rohe Zufallsbytes an (siehe save_vault). Ältere Tresore
+    # tragen das Padding als base64-Feld in den Metadaten und bleiben lesbar.
+    nul = plaintext.find(b"\x00")
+    if nul != -1:
+        plaintext = plaintext[:nul]
+    obj = _json_loads(plaintext)
     # Prüfe optionale Flags aus dem Meta-Bereich des Tresors und vergleiche mit
     # den aktuellen Konfigurationen. Bit 0 = Keyfile verwendet, Bit 1 = Gerätebindung verwendet.
     try:
@@ -3216,6 +3925,25 @@ def load_vault(path: Path, master_pw_str: str) -> Vault:
 # ====================================
 # SECTION H — Export Funktionen (TXT / CSV) & Clipboard
 
+# Einzelner Timer für das automatische Leeren der Zwischenablage. Statt pro
+# Kopiervorgang einen schlafenden Hintergrund-Thread zu starten, wird ein
+# threading.Timer verwendet; ein noch ausstehender Timer wird zuvor
+# abgebrochen, damit sich Lösch-Aufträge bei mehrfachem Kopieren nicht stapeln.
+_CLIP_CLEAR_TIMER: Optional[threading.Timer] = None
+
+def _schedule_clip_clear(clear_func: Callable[[], None], seconds: float) -> None:
+    """Plant das Leeren der Zwischenablage nach ``seconds`` Sekunden ein."""
+    global _CLIP_CLEAR_TIMER
+    try:
+        if _CLIP_CLEAR_TIMER is not None:
+            _CLIP_CLEAR_TIMER.cancel()
+        t = threading.Timer(max(1.0, float(seconds)), clear_func)
+        t.daemon = True
+        t.start()
+        _CLIP_CLEAR_TIMER = t
+    except Exception:
+        pass
+
 def _cli_set_clipboard_temporarily(text: str, seconds: int = CLI_CLIPBOARD_CLEAR_SECONDS) -> None:
     """
     Copy the provided text to the clipboard for a limited amount of time.
@@ -3243,12 +3971,10 @@ def _cli_set_clipboard_temporarily(text: str, seconds: int = CLI_CLIPBOARD_CLEAR
         )
         def _wipe() -> None:
             try:
-                time.sleep(max(1, int(seconds)))
                 pyperclip.copy("")
             except Exception:
                 pass
-        t = threading.Thread(target=_wipe, daemon=True)
-        t.start()
+        _schedule_clip_clear(_wipe, seconds)
     except Exception:
         print(
             tr(
@@ -3274,6 +4000,38 @@ def _confirm_dangerous_export_cli() -> bool:
 
 # Duplicate definition of export_entry_txt removed
 
+# Warnbanner und Eintragsvorlagen für die Klartext-Exporte. Als
+# Modulkonstanten ohne Einrückung definiert, damit weder textwrap.dedent
+# noch ein f-String-Aufbau pro Eintrag nötig ist.
+_EXPORT_BANNER = (
+    "############################### GEHEIM ###############################\n"
+    "# KLARTEXT-EXPORT – Passwörter sind unverschlüsselt in dieser Datei #\n"
+    "#####################################################################\n\n"
+)
+
+_EXPORT_ENTRY_TPL = (
+    "Label       : {label}\n"
+    "Benutzer    : {username}\n"
+    "Email       : {email}\n"
+    "Passwort    : {password}\n"
+    "Info        : {info}\n"
+    "Webseite/IP : {website}\n"
+    "Erstellt    : {created}\n"
+    "Geändert    : {updated}\n"
+)
+
+_EXPORT_ALL_ENTRY_TPL = (
+    "=== {label} ({id}) ===\n"
+    "Benutzer    : {username}\n"
+    "Email       : {email}\n"
+    "Passwort    : {password}\n"
+    "Info        : {info}\n"
+    "Webseite/IP : {website}\n"
+    "Erstellt    : {created}\n"
+    "Geändert    : {updated}\n"
+    "\n"
+)
+
 def export_entry_txt(v: Vault, eid: str, outpath: Optional[Path] = None) -> Path:
     if REQUIRE_EXPLICIT_EXPORT_CONFIRM and not _confirm_dangerous_export_cli():
         raise RuntimeError("Export vom Nutzer abgebrochen.")
@@ -3281,22 +4039,12 @@ def export_entry_txt(v: Vault, eid: str, outpath: Optional[Path] = None) -> Path
         raise KeyError("Eintrag nicht gefunden")
     e = v.entries[eid]
     fname = outpath if outpath else Path(f"export_{safe_filename(e.label)}.txt")
-    banner = (
-        "############################### GEHEIM ###############################\n"
-        "# KLARTEXT-EXPORT – Passwörter sind unverschlüsselt in dieser Datei #\n"
-        "#####################################################################\n\n"
+    content = _EXPORT_ENTRY_TPL.format(
+        label=e.label, username=e.username, email=e.email, password=e.password,
+        info=e.info, website=e.website,
+        created=fmt_de(e.created_at), updated=fmt_de(e.updated_at),
     )
-    content = textwrap.dedent(f"""\
-Label       : {e.label}
-Benutzer    : {e.username}
-Email       : {e.email}
-Passwort    : {e.password}
-Info        : {e.info}
-Webseite/IP : {e.website}
-Erstellt    : {fmt_de(e.created_at)}
-Geändert    : {fmt_de(e.updated_at)}
-""")
-    _secure_write_text(fname, banner + content)
+    _secure_write_text(fname, _EXPORT_BANNER + content)
     write_audit("export_entry", f"{eid}|{e.label}")
     return fname
 
@@ -3304,26 +4052,16 @@ def export_all_txt(v: Vault, outpath: Optional[Path] = None) -> Path:
     if REQUIRE_EXPLICIT_EXPORT_CONFIRM and not _confirm_dangerous_export_cli():
         raise RuntimeError("Export vom Nutzer abgebrochen.")
     fname = outpath if outpath else Path("export_all_entries.txt")
-    import io
-    buf = io.StringIO()
-    buf.write(
-        "############################### GEHEIM ###############################\n"
-        "# KLARTEXT-EXPORT – Passwörter sind unverschlüsselt in dieser Datei #\n"
-        "#####################################################################\n\n"
-    )
-    for e in v.entries.values():
-        buf.write(textwrap.dedent(f"""\
-=== {e.label} ({e.id}) ===
-Benutzer    : {e.username}
-Email       : {e.email}
-Passwort    : {e.password}
-Info        : {e.info}
-Webseite/IP : {e.website}
-Erstellt    : {fmt_de(e.created_at)}
-Geändert    : {fmt_de(e.updated_at)}
-
-"""))
-    _secure_write_text(fname, buf.getvalue())
+    # Direkt in die Datei streamen: der Speicherbedarf bleibt bei einem
+    # Eintragsblock plus Schreibpuffer, egal wie groß der Tresor ist.
+    with _secure_open_write(fname) as f:
+        f.write(_EXPORT_BANNER)
+        for e in v.entries.values():
+            f.write(_EXPORT_ALL_ENTRY_TPL.format(
+                label=e.label, id=e.id, username=e.username, email=e.email,
+                password=e.password, info=e.info, website=e.website,
+                created=fmt_de(e.created_at), updated=fmt_de(e.updated_at),
+            ))
     write_audit("export_all", f"{len(v.entries)} entries (txt)")
     return fname
 def export_all_csv(v: Vault, outpath: Optional[Path] = None) -> Path:
@@ -3332,12 +4070,57 @@ def export_all_csv(v: Vault, outpath: Optional[Path] = None) -> Path:
     buf = io.StringIO(newline="")
     writer = csv.writer(buf)
     writer.writerow(["ID", "Label", "Benutzer", "Email", "Passwort", "Info", "Webseite/IP", "Erstellt", "Geändert"])
-    for e in v.entries.values():
-        writer.writerow([e.id, e.label, e.username, e.email, e.password, e.info, e.website,
-                         fmt_de(e.created_at), fmt_de(e.updated_at)])
+    # writerows iteriert in C über den Generator, statt pro Zeile neu aus
+    # Python in das csv-Modul einzutreten.
+    writer.writerows(
+        (e.id, e.label, e.username, e.email, e.password, e.info, e.website,
+         fmt_de(e.created_at), fmt_de(e.updated_at))
+        for e in v.entries.values()
+    )
     _secure_write_text(fname, buf.getvalue(), newline=True)
     return fname
 
+# Monatsnamen des ctime-Formats ("%a %b %d %H:%M:%S %Y"), in dem ältere
+# Exporte ihre Zeitstempel ablegten.
+# Erwartete Spalten einer Export-CSV; als frozenset-Konstante, damit der
+# Header-Check pro Import keine neuen Set-Objekte aufbaut.
+_EXPECTED_CSV_COLS = frozenset((
+    "ID", "Label", "Benutzer", "Email", "Passwort", "Info",
+    "Webseite/IP", "Erstellt", "Geändert",
+))
+
+_CTIME_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+@functools.lru_cache(maxsize=4096)
+def _parse_export_time(val: str) -> Optional[float]:
+    """
+    Parst einen Zeitstempel aus einer Export-CSV. Zuerst wird das vom
+    eigenen Export (``fmt_de``) geschriebene Format ``TT.MM.JJJJ HH:MM:SS``
+    versucht, danach das ctime-Format älterer Exporte. Beide Wege zerlegen
+    den String direkt, statt die Formatmaschine von ``time.strptime`` pro
+    Zeile zu durchlaufen; identische Strings (Massenimporte) kommen aus dem
+    Cache. Bei unlesbaren Werten wird ``None`` zurückgegeben, der Aufrufer
+    setzt dann den aktuellen Zeitpunkt ein.
+    """
+    s = val.strip()
+    try:
+        date_part, time_part = s.split(" ")
+        d, mo, y = date_part.split(".")
+        h, mi, sec = time_part.split(":")
+        return time.mktime((int(y), int(mo), int(d), int(h), int(mi), int(sec), -1, -1, -1))
+    except Exception:
+        pass
+    try:
+        parts = s.split()
+        h, mi, sec = parts[3].split(":")
+        return time.mktime((int(parts[4]), _CTIME_MONTHS[parts[1]], int(parts[2]),
+                            int(h), int(mi), int(sec), -1, -1, -1))
+    except Exception:
+        return None
+
 def import_entries_from_csv(v: Vault, csv_path: Path) -> int:
     """Importiert Einträge aus einer CSV‑Datei in den angegebenen Tresor.
 
@@ -3352,35 +4135,49 @@ def import_entries_from_csv(v: Vault, csv_path: Path) -> int:
     :param csv_path: Pfad zur zu importierenden CSV‑Datei.
     :return: Anzahl erfolgreich importierter Einträge.
     """
+    import csv
     imported = 0
-    # Öffne CSV‑Datei und lese Zeilen mit csv.DictReader
+    # csv.reader statt DictReader: kein frisches Dict pro Zeile; die
+    # Spaltenpositionen werden einmal aus der Kopfzeile bestimmt.
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
         # Prüfe, ob die erwarteten Spalten vorhanden sind
-        expected = {"ID", "Label", "Benutzer", "Email", "Passwort", "Info", "Webseite/IP", "Erstellt", "Geändert"}
-        if reader.fieldnames is None or not expected.issubset(set(reader.fieldnames)):
+        if header is None or not _EXPECTED_CSV_COLS.issubset(header):
             raise ValueError("CSV-Header entspricht nicht dem erwarteten Format.")
+        idx = {name: i for i, name in enumerate(header)}
+        i_label = idx["Label"]; i_user = idx["Benutzer"]; i_email = idx["Email"]
+        i_pw = idx["Passwort"]; i_info = idx["Info"]; i_site = idx["Webseite/IP"]
+        i_created = idx["Erstellt"]; i_updated = idx["Geändert"]
+        # Neue Einträge erst lokal sammeln und am Ende in einem Rutsch in den
+        # Tresor übernehmen; das erspart dem Tresor-Dict die wiederholten
+        # Vergrößerungen bei großen Importen.
+        new_entries: Dict[str, Entry] = {}
         for row in reader:
             try:
-                # Erzeuge neue ID, um Konflikte zu vermeiden
+                # Erzeuge neue ID, um Konflikte zu vermeiden — auch mit den
+                # bereits in diesem Import vergebenen IDs
                 eid = generate_entry_id(v.entries)
-                # Lese Felder; fallback auf leere Strings
-                label = row.get("Label", "").strip()
-                username = row.get("Benutzer", "").strip()
-                email = row.get("Email", "").strip()
-                password = row.get("Passwort", "").strip()
-                info = row.get("Info", "").strip()
-                website = row.get("Webseite/IP", "").strip()
-                # Parse Zeitstempel (falls möglich)
-                def parse_time(val: str) -> float:
-                    try:
-                        return time.mktime(time.strptime(val.strip(), "%a %b %d %H:%M:%S %Y"))
-                    except Exception:
-                        return time.time()
-                created_at = parse_time(row.get("Erstellt", ""))
-                updated_at = parse_time(row.get("Geändert", ""))
+                while eid in new_entries:
+                    eid = generate_entry_id(v.entries)
+                # Lese Felder direkt über die Spaltenindizes; der Export
+                # schreibt keine umgebenden Leerzeichen, ein strip() pro
+                # Feld würde nur neue Strings allozieren.
+                label = row[i_label]
+                username = row[i_user]
+                email = row[i_email]
+                password = row[i_pw]
+                info = row[i_info]
+                website = row[i_site]
+                # Parse Zeitstempel (falls möglich); der Parser strippt selbst
+                created_at = _parse_export_time(row[i_created])
+                if created_at is None:
+                    created_at = time.time()
+                updated_at = _parse_export_time(row[i_updated])
+                if updated_at is None:
+                    updated_at = time.time()
                 # Füge Entry hinzu
-                v.entries[eid] = Entry(
+                new_entries[eid] = Entry(
                     id=eid,
                     label=label,
                     username=username,
@@ -3395,43 +4192,100 @@ def import_entries_from_csv(v: Vault, csv_path: Path) -> int:
             except Exception:
                 # Überspringe Zeilen mit Fehlern
                 continue
+        v.entries.update(new_entries)
     # Aktualisiere Tresor-Timestamp
     if imported:
         v.updated_at = time.time()
     return imported
 
-def cli_copy_to_clipboard(text: str) -> None:
-    # Um Clipboard‑Operationen zu vereinheitlichen, definieren wir eine interne
-    # Funktion, die je nach Plattform versucht, einen String in die
-    # Zwischenablage zu kopieren. Sie gibt True zurück, wenn das Kopieren
-    # erfolgreich war.
-    def _copy(payload: str) -> bool:
-        if _HAS_PYPERCLIP:
-            try:
-                pyperclip.copy(payload)
-                return True
-            except Exception:
-                return False
+def _set_clipboard_windows(payload: str) -> bool:
+    """
+    Setzt die Windows-Zwischenablage direkt über die Win32-API (ctypes),
+    ohne pro Kopiervorgang einen PowerShell-Prozess zu starten, dessen
+    Startzeit im Sekundenbereich liegen kann.
+    """
+    import ctypes
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+    # restype/argtypes explizit setzen: ohne sie behandelt ctypes die
+    # Rückgaben als 32-Bit-int, womit Handles und Zeiger auf 64-Bit-Windows
+    # gestutzt würden — memmove auf einen gestutzten Zeiger ist ein Absturz,
+    # kein sauber abfangbarer Fehler.
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+    kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        data = payload.encode("utf-16-le") + b"\x00\x00"
+        handle = kernel32.GlobalAlloc(0x0002, len(data))  # GMEM_MOVEABLE
+        if not handle:
+            return False
+        ptr = kernel32.GlobalLock(handle)
+        if not ptr:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(ptr, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(13, handle):  # CF_UNICODETEXT
+            kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
+
+def _set_clipboard_text(payload: str) -> bool:
+    """
+    Kopiert ``payload`` plattformabhängig in die Zwischenablage. Gibt True
+    zurück, wenn das Kopieren erfolgreich war. Wird sowohl vom Kopieren
+    selbst als auch vom automatischen Leeren verwendet.
+
+    xclip/pbcopy werden weiterhin pro Aufruf gestartet: beide lesen stdin
+    bis EOF und übernehmen erst dann die Selektion, ein dauerhaft offener
+    Helfer-Prozess ist mit diesem Protokoll nicht möglich. Teuer war vor
+    allem der PowerShell-Start unter Windows — der entfällt jetzt durch
+    den direkten Win32-Aufruf.
+    """
+    if _HAS_PYPERCLIP:
         try:
-            if sys.platform.startswith("linux"):
-                p = subprocess.Popen(["xclip", "-selection", "clipboard"], stdin=subprocess.PIPE)
-                p.communicate(payload.encode("utf-8"))
-                return True
-            elif sys.platform == "darwin":
-                p = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
-                p.communicate(payload.encode("utf-8"))
-                return True
-            elif os.name == "nt":
-                # Windows-Fallback: nutze PowerShell zum Setzen der Zwischenablage
-                # (Set-Clipboard in neueren PowerShell-Versionen)
-                cmd = "Set-Clipboard -Value $args[0]"
-                subprocess.run(["powershell", "-NoProfile", "-Command", cmd, payload], check=True)
-                return True
+            pyperclip.copy(payload)
+            return True
         except Exception:
             return False
+    try:
+        if sys.platform.startswith("linux"):
+            p = subprocess.Popen(["xclip", "-selection", "clipboard"], stdin=subprocess.PIPE)
+            p.communicate(payload.encode("utf-8"))
+            return True
+        elif sys.platform == "darwin":
+            p = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
+            p.communicate(payload.encode("utf-8"))
+            return True
+        elif os.name == "nt":
+            try:
+                if _set_clipboard_windows(payload):
+                    return True
+            except Exception:
+                pass
+            # Fallback: PowerShell (Set-Clipboard in neueren Versionen)
+            cmd = "Set-Clipboard -Value $args[0]"
+            subprocess.run(["powershell", "-NoProfile", "-Command", cmd, payload], check=True)
+            return True
+    except Exception:
         return False
+    return False
 
-    success = _copy(text)
+def cli_copy_to_clipboard(text: str) -> None:
+    success = _set_clipboard_text(text)
     if success:
         print(
             tr(
@@ -3439,20 +4293,15 @@ def cli_copy_to_clipboard(text: str) -> None:
                 "Password copied to clipboard.",
             )
         )
-        # Starte einen Hintergrund-Thread, der nach Ablauf von CLIP_CLEAR_MS die
-        # Zwischenablage wieder leert. Dadurch wird das Passwort nach einer
+        # Plane das Leeren der Zwischenablage nach CLIP_CLEAR_MS über den
+        # gemeinsamen Timer ein. Dadurch wird das Passwort nach einer
         # bestimmten Zeit automatisch entfernt.
         def _clear_clipboard() -> None:
-            time.sleep(CLIP_CLEAR_MS / 1000.0)
             try:
-                _copy("")
+                _set_clipboard_text("")
             except Exception:
                 pass
-        try:
-            t = threading.Thread(target=_clear_clipboard, daemon=True)
-            t.start()
-        except Exception:
-            pass
+        _schedule_clip_clear(_clear_clipboard, CLIP_CLEAR_MS / 1000.0)
     else:
         print(
             tr(
@@ -3464,6 +4313,22 @@ def cli_copy_to_clipboard(text: str) -> None:
 # ====================================
 # SECTION I — Passwortstärkeprüfung (optional, informativ)
 # ====================================
+# Übersetzungstabelle für die Passwort-Bewertung: ASCII-Zeichen werden per
+# str.translate (ein C-Durchlauf) auf einen Klassenbuchstaben abgebildet.
+# Nicht erfasste Zeichen (z. B. Umlaute) bleiben erhalten und werden unten
+# einzeln nachklassifiziert — pro *unterschiedlichem* Zeichen, nicht pro
+# Vorkommen.
+_PW_CLASS_MAP = str.maketrans(
+    {c: "L" for c in string.ascii_lowercase}
+    | {c: "U" for c in string.ascii_uppercase}
+    | {c: "D" for c in string.digits}
+    | {c: "S" for c in "!@#$_-+.^*?"}
+)
+
+# Häufige Muster in einem vorkompilierten Alternationsmuster statt fünf
+# einzelner Substring-Suchen.
+_COMMON_PW_RE = re.compile("password|1234|qwerty|admin|letmein")
+
 def password_strength(password: str) -> Tuple[str, int]:
     """
     Einfache Heuristik: bewertet Passwort auf 0-100 und Kategorie.
@@ -3473,15 +4338,26 @@ def password_strength(password: str) -> Tuple[str, int]:
     length = len(password)
     if length >= 8:
         score += min(10, (length - 7) * 2)  # kleine Gewichtung für Länge
-    # variety
-    if any(c.islower() for c in password): score += 20
-    if any(c.isupper() for c in password): score += 20
-    if any(c.isdigit() for c in password): score += 20
-    if any(c in "!@#$_-+.^*?" for c in password): score += 20
+    # variety — str.translate kollabiert das Passwort in einem C-Durchlauf
+    # auf Klassenbuchstaben; danach wird nur noch die kleine Menge der
+    # unterschiedlichen Zeichen betrachtet.
+    classes = set(password.translate(_PW_CLASS_MAP))
+    has_low = "L" in classes
+    has_up = "U" in classes
+    has_digit = "D" in classes
+    has_special = "S" in classes
+    # Nicht-ASCII-Reste (Umlaute etc.) zählen weiterhin zu den Buchstaben-
+    # bzw. Ziffernklassen.
+    for c in classes - {"L", "U", "D", "S"}:
+        if c.islower():
+            has_low = True
+        elif c.isupper():
+            has_up = True
+        elif c.isdigit():
+            has_digit = True
+    score += 20 * (has_low + has_up + has_digit + has_special)
     # penalize common patterns
-    lowers = password.lower()
-    commons = ["password", "1234", "qwerty", "admin", "letmein"]
-    if any(s in lowers for s in commons): score = max(10, score - 30)
+    if _COMMON_PW_RE.search(password.lower()): score = max(10, score - 30)
     score = max(0, min(100, score))
     if score < 40:
         cat = "SCHWACH"
@@ -3885,10 +4761,13 @@ def cli_loop(path: Path, safe_mode: bool = SAFE_CLI_DEFAULT) -> None:
         vault = Vault.empty()
         save_vault(path, vault, master_pw)
         print(tr("Leerer Tresor erstellt und gespeichert.", "Empty vault created and saved."))
-    # Führe ggf. automatische Schlüsselrotation durch
+    # Führe ggf. automatische Schlüsselrotation durch. Das Tresoralter wird
+    # nur einmal berechnet und an beide Prüfungen durchgereicht.
+    age = _vault_age_days(vault)
     try:
-        rotated = auto_rotate_if_due(path, vault, master_pw)
+        rotated = auto_rotate_if_due(path, vault, master_pw, age_days=age)
         if rotated:
+            age = 0.0
             print(tr(
                 "Tresor wurde automatisch neu verschlüsselt (Schlüsselrotation)",
                 "Vault was automatically re-encrypted (key rotation)"
@@ -3898,7 +4777,7 @@ def cli_loop(path: Path, safe_mode: bool = SAFE_CLI_DEFAULT) -> None:
         pass
 
     # Prüfe, ob eine Schlüsselrotation empfohlen wird (Warnung in CLI ausgeben)
-    maybe_warn_rotation_cli(vault)
+    maybe_warn_rotation_cli(vault, age_days=age)
     while True:
         # Lösche Bildschirm vor jeder Menüdarstellung, um die CLI sauber zu halten
         try:
@@ -3948,8 +4827,7 @@ def cli_loop(path: Path, safe_mode: bool = SAFE_CLI_DEFAULT) -> None:
                 print(tr("Hinzugefügt und gespeichert:", "Added and saved:"), eid)
             finally:
                 # Überschreibe das Passwort im Speicher, um seine Verweildauer zu minimieren
-                for i in range(len(_pw_bytes)):
-                    _pw_bytes[i] = 0
+                wipe_bytes(_pw_bytes)
                 del _pw_bytes
         elif choice == "4":
             eid = input(tr("Eintrags-ID: ", "Entry ID: ")).strip()
@@ -3980,8 +4858,7 @@ def cli_loop(path: Path, safe_mode: bool = SAFE_CLI_DEFAULT) -> None:
                 print(tr("Eintrag aktualisiert und gespeichert.", "Entry updated and saved."))
                 # Lösche temporäres Passwort aus Speicher (falls gesetzt)
                 try:
-                    for i in range(len(_pw_bytes2)):
-                        _pw_bytes2[i] = 0
+                    wipe_bytes(_pw_bytes2)
                     del _pw_bytes2
                 except Exception:
                     pass
@@ -4227,13 +5104,30 @@ def import_tk():
     except Exception:
         return None, None, None, None, None
 
-tk, ttk, messagebox, simpledialog, filedialog = import_tk()
+# Die Tk-Module werden erst beim ersten GUI-Start geladen (lazy), damit der
+# reine CLI-Betrieb nicht den kompletten tkinter-Stack importieren muss.
+tk = ttk = messagebox = simpledialog = filedialog = None
+
+def _ensure_tk() -> bool:
+    """Lädt tkinter bei Bedarf nach und füllt die Modul-Globals."""
+    global tk, ttk, messagebox, simpledialog, filedialog
+    if tk is None:
+        tk, ttk, messagebox, simpledialog, filedialog = import_tk()
+        if tk is not None:
+            # Nachgelagerte GUI-Patches (z.B. Click-to-Reveal) anwenden
+            try:
+                patch = globals().get("_wlk_install_reveal_patch")
+                if patch:
+                    patch()
+            except Exception:
+                pass
+    return tk is not None
 
 def launch_gui(path: Path) -> None:
     """
     Startet die Tkinter GUI. Falls Tk nicht vorhanden, wird eine Meldung ausgegeben.
     """
-    if tk is None:
+    if not _ensure_tk():
         print("Tkinter nicht verfügbar. Starte CLI mit --cli.")
         return
 
@@ -4322,15 +5216,12 @@ def launch_gui(path: Path) -> None:
             # Versuche, ein eigenes Icon zu setzen. Falls dies fehlschlägt (z. B. auf
             # Plattformen ohne PhotoImage-Support), bleibt das Standard-Icon bestehen.
             try:
-                import base64
-                import tkinter as tk  # Import hier erneut, falls oben nicht geladen
-                _icon_data = ICON_PNG_BASE64
-                # Tk akzeptiert Base64-kodierte PNG-Bilder direkt im data-Parameter.
-                icon_image = tk.PhotoImage(data=_icon_data)
-                # Die Referenz wird in der Instanz gespeichert, um sie vor dem
-                # Garbage Collector zu schützen.
-                self._icon_image = icon_image
-                self.root.iconphoto(True, icon_image)
+                icon_image = get_icon_photoimage()
+                if icon_image is not None:
+                    # Die Referenz wird in der Instanz gespeichert, um sie vor dem
+                    # Garbage Collector zu schützen.
+                    self._icon_image = icon_image
+                    self.root.iconphoto(True, icon_image)
             except Exception:
                 pass
             root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -5051,7 +5942,7 @@ def launch_gui(path: Path) -> None:
                     if not url.startswith("http://") and not url.startswith("https://"):
                         url = "https://" + url
                     try:
-                        webbrowser.open(url)
+                        _open_url(url)
                     except Exception:
                         pass
                 link_lbl.bind("<Button-1>", _open_link)
@@ -5171,14 +6062,15 @@ def launch_gui(path: Path) -> None:
                 # Audit: vault unlocked
                 write_audit("unlock", f"{self.path}")
                 # Prüfe automatische Schlüsselrotation (still, Fehler ignorieren)
+                age = _vault_age_days(self.vault)
                 try:
-                    rotated = auto_rotate_if_due(self.path, self.vault, self.master_pw)
+                    rotated = auto_rotate_if_due(self.path, self.vault, self.master_pw, age_days=age)
                     if rotated:
-                        pass
+                        age = 0.0
                 except Exception:
                     pass
                 # Warnung ggf. anzeigen
-                maybe_warn_rotation_gui(self.vault)
+                maybe_warn_rotation_gui(self.vault, age_days=age)
                 # Aktivitätszeit zurücksetzen und Hauptansicht aufbauen
                 self.last_activity = time.time()
                 # Aktualisiere Liste der zuletzt verwendeten Tresore
@@ -5706,7 +6598,7 @@ def launch_gui(path: Path) -> None:
                     if not url.startswith("http://") and not url.startswith("https://"):
                         url = "https://" + url
                     try:
-                        webbrowser.open(url)
+                        _open_url(url)
                     except Exception:
                         pass
                 adv_link.bind("<Button-1>", _open_adv_link)
@@ -5835,7 +6727,7 @@ def launch_gui(path: Path) -> None:
                     if target and not target.lower().startswith(("http://", "https://")):
                         target = "https://" + target
                     try:
-                        webbrowser.open(target)
+                        _open_url(target)
                     except Exception:
                         pass
                 link_label.bind("<Button-1>", _open_website)
@@ -6056,7 +6948,7 @@ def launch_gui(path: Path) -> None:
                                         if url_link.startswith("www."):
                                             url_link = "https://" + url_link
                                         try:
-                                            webbrowser.open(url_link)
+                                            _open_url(url_link)
                                         except Exception:
                                             pass
                                     lbl_cell.bind("<Button-1>", open_link)
@@ -6070,7 +6962,7 @@ def launch_gui(path: Path) -> None:
                                             else:
                                                 url2 = url_link
                                             try:
-                                                webbrowser.open(url2)
+                                                _open_url(url2)
                                             except Exception:
                                                 pass
                                         menu.add_command(label=tr("Link öffnen", "Open link"), command=_open)
@@ -6448,7 +7340,7 @@ def launch_gui(path: Path) -> None:
                                         if url_link.startswith("www."):
                                             url_link = "https://" + url_link
                                         try:
-                                            webbrowser.open(url_link)
+                                            _open_url(url_link)
                                         except Exception:
                                             pass
                                     lbl_cell.bind("<Button-1>", _open)
@@ -6515,7 +7407,7 @@ def launch_gui(path: Path) -> None:
                     if url_to_open.startswith("www."):
                         url_to_open = "https://" + url_to_open
                     try:
-                        webbrowser.open(url_to_open)
+                        _open_url(url_to_open)
                     except Exception:
                         pass
                     return
@@ -6658,7 +7550,7 @@ def launch_gui(path: Path) -> None:
                         else:
                             url2 = url
                         try:
-                            webbrowser.open(url2)
+                            _open_url(url2)
                         except Exception:
                             pass
                     menu.add_command(label=tr("Link öffnen", "Open link"), command=open_link)
@@ -7309,7 +8201,7 @@ def launch_gui(path: Path) -> None:
                     if url_to_open2.startswith("www."):
                         url_to_open2 = "https://" + url_to_open2
                     try:
-                        webbrowser.open(url_to_open2)
+                        _open_url(url_to_open2)
                     except Exception:
                         pass
                     return
@@ -7424,7 +8316,7 @@ def launch_gui(path: Path) -> None:
                         url = cell_val
                         url2 = ("https://" + url) if url.startswith("www.") else url
                         try:
-                            webbrowser.open(url2)
+                            _open_url(url2)
                         except Exception:
                             pass
                     menu.add_command(label=tr("Link öffnen", "Open link"), command=open_link)
@@ -9344,7 +10236,7 @@ def launch_gui(path: Path) -> None:
             from tkinter import messagebox
             url = "https://haveibeenpwned.com/passwords"
             try:
-                webbrowser.open(url)
+                _open_url(url)
             except Exception:
                 messagebox.showinfo(tr("Info", "Info"), tr("Konnte Browser nicht öffnen.", "Could not open browser."), parent=self.root)
 
@@ -9405,6 +10297,11 @@ def launch_gui(path: Path) -> None:
                     save_vault(self.path, self.vault, self.master_pw)
                 except Exception:
                     pass
+            # Abgeleitete Schlüssel werden nach Programmende nicht mehr gebraucht
+            try:
+                clear_kdf_cache()
+            except Exception:
+                pass
             self.root.destroy()
 
         def show_help(self):
@@ -9950,28 +10847,40 @@ except Exception:
     pass
 
 # 2) HTTPS validation for Telegram link opening by wrapping webbrowser.open
-try:
-    import webbrowser as _wb
-    import urllib.parse as _urlp
-    _orig_open = _wb.open
+# Der Wrapper wird erst installiert, wenn webbrowser wirklich geladen wird
+# (siehe _open_url), damit der Programmstart das Modul nicht importieren muss.
+def _wlk_install_safe_open_patch():
+    try:
+        import webbrowser as _wb
+        import urllib.parse as _urlp
+        if getattr(_wb.open, "_wlk_safe", False):
+            return
+        _orig_open = _wb.open
 
-    def _wlk_safe_open(url, *args, **kwargs):
-        try:
-            u = str(url).strip()
-            parsed = _urlp.urlparse(u if u else "")
-            if not parsed.scheme:
-                u = "https://" + u
-                parsed = _urlp.urlparse(u)
-            # enforce https for Telegram links (t.me / telegram.me)
-            host = (parsed.netloc or "").lower()
-            if "t.me" in host or "telegram.me" in host or "telegram.org" in host:
-                if parsed.scheme != "https":
-                    return False
-            return _orig_open(u, *args, **kwargs)
-        except Exception:
-            return False
+        def _wlk_safe_open(url, *args, **kwargs):
+            try:
+                u = str(url).strip()
+                parsed = _urlp.urlparse(u if u else "")
+                if not parsed.scheme:
+                    u = "https://" + u
+                    parsed = _urlp.urlparse(u)
+                # enforce https for Telegram links (t.me / telegram.me)
+                host = (parsed.netloc or "").lower()
+                if "t.me" in host or "telegram.me" in host or "telegram.org" in host:
+                    if parsed.scheme != "https":
+                        return False
+                return _orig_open(u, *args, **kwargs)
+            except Exception:
+                return False
+
+        _wlk_safe_open._wlk_safe = True
+        _wb.open = _wlk_safe_open
+    except Exception:
+        pass
 
-    _wb.open = _wlk_safe_open
+try:
+    if "webbrowser" in sys.modules:
+        _wlk_install_safe_open_patch()
 except Exception:
     pass
 
@@ -10210,67 +11119,76 @@ except Exception:
     pass
 
 # 5) Click-to-Reveal / Auto-Mask for entry display windows
-try:
-    import tkinter as _tk
-    _orig_toplevel_init = getattr(_tk.Toplevel, "__init__", None)
-    if _orig_toplevel_init is not None:
-        def _toplevel_init_wrapper(self, *a, **k):
-            _orig_toplevel_init(self, *a, **k)
-            try:
-                self.after(120, lambda: _post_process_toplevel(self))
-            except Exception:
-                pass
-
-        def _post_process_toplevel(win):
-            try:
-                title = ""
+# Der Patch wird erst angewendet, wenn tkinter tatsächlich geladen wird
+# (siehe _ensure_tk), damit der CLI-Start tkinter nicht importieren muss.
+def _wlk_install_reveal_patch():
+    try:
+        import tkinter as _tk
+        _orig_toplevel_init = getattr(_tk.Toplevel, "__init__", None)
+        if _orig_toplevel_init is not None:
+            def _toplevel_init_wrapper(self, *a, **k):
+                _orig_toplevel_init(self, *a, **k)
                 try:
-                    title = win.title()
+                    self.after(120, lambda: _post_process_toplevel(self))
                 except Exception:
-                    return
-                if not isinstance(title, str) or not title.startswith("Anzeigen:"):
-                    return
-                def walk(w):
-                    for child in list(w.winfo_children()):
-                        try:
-                            txt = None
-                            if hasattr(child, "cget"):
-                                try:
-                                    txt = child.cget("text")
-                                except Exception:
-                                    txt = None
-                            if isinstance(txt, str) and ("Passwort" in txt or "passwort" in txt.lower()):
-                                parts = txt.split(":", 1)
-                                pw = parts[1].strip() if len(parts) > 1 else ""
-                                import tkinter as tk
-                                parent = child.master or w
-                                frm = tk.Frame(parent)
-                                masked = tk.StringVar(value="•" * max(6, len(pw)))
-                                lbl = tk.Label(frm, textvariable=masked)
-                                lbl.pack(side="left", padx=(0,8))
-                                def reveal():
+                    pass
+
+            def _post_process_toplevel(win):
+                try:
+                    title = ""
+                    try:
+                        title = win.title()
+                    except Exception:
+                        return
+                    if not isinstance(title, str) or not title.startswith("Anzeigen:"):
+                        return
+                    def walk(w):
+                        for child in list(w.winfo_children()):
+                            try:
+                                txt = None
+                                if hasattr(child, "cget"):
                                     try:
-                                        masked.set(pw)
-                                        if AUTO_MASK_REVEAL_MS and int(AUTO_MASK_REVEAL_MS) > 0:
-                                            win.after(int(AUTO_MASK_REVEAL_MS), lambda: masked.set("•" * max(6, len(pw))))
+                                        txt = child.cget("text")
+                                    except Exception:
+                                        txt = None
+                                if isinstance(txt, str) and ("Passwort" in txt or "passwort" in txt.lower()):
+                                    parts = txt.split(":", 1)
+                                    pw = parts[1].strip() if len(parts) > 1 else ""
+                                    import tkinter as tk
+                                    parent = child.master or w
+                                    frm = tk.Frame(parent)
+                                    masked = tk.StringVar(value="•" * max(6, len(pw)))
+                                    lbl = tk.Label(frm, textvariable=masked)
+                                    lbl.pack(side="left", padx=(0,8))
+                                    def reveal():
+                                        try:
+                                            masked.set(pw)
+                                            if AUTO_MASK_REVEAL_MS and int(AUTO_MASK_REVEAL_MS) > 0:
+                                                win.after(int(AUTO_MASK_REVEAL_MS), lambda: masked.set("•" * max(6, len(pw))))
+                                        except Exception:
+                                            pass
+                                    btn = tk.Button(frm, text="Anzeigen", command=reveal)
+                                    btn.pack(side="left")
+                                    try:
+                                        child.destroy()
                                     except Exception:
                                         pass
-                                btn = tk.Button(frm, text="Anzeigen", command=reveal)
-                                btn.pack(side="left")
-                                try:
-                                    child.destroy()
-                                except Exception:
-                                    pass
-                                frm.pack(fill="x", padx=4, pady=2)
-                            else:
-                                walk(child)
-                        except Exception:
-                            pass
-                walk(win)
-            except Exception:
-                pass
+                                    frm.pack(fill="x", padx=4, pady=2)
+                                else:
+                                    walk(child)
+                            except Exception:
+                                pass
+                    walk(win)
+                except Exception:
+                    pass
+
+            _tk.Toplevel.__init__ = _toplevel_init_wrapper
+    except Exception:
+        pass
 
-        _tk.Toplevel.__init__ = _toplevel_init_wrapper
+try:
+    if "tkinter" in sys.modules:
+        _wlk_install_reveal_patch()
 except Exception:
     pass
 